@@ -10,44 +10,75 @@ import re
 import numpy as np
 import pandas as pd
 from config import (TIME_COLUMN, SELECTED_COLUMNS, DELINEATING_COL)
+from bin.helpers_numba import NUMBA_AVAILABLE, group_reduce
+
+def ensure_naive_time(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Purpose:
+    - Converts TIME_COLUMN to naive datetime64[ns] (UTC, no timezone info) in place.
+    - Skips the expensive string parse when the column is already naive datetime, so the
+      worker, melt and bin steps only pay for it once.
+    Args:
+    - df (pd.DataFrame): DataFrame containing TIME_COLUMN.
+    Returns:
+    - pd.DataFrame: The same DataFrame, for chaining.
+    """
+    if pd.api.types.is_datetime64_ns_dtype(df[TIME_COLUMN]) and df[TIME_COLUMN].dt.tz is None:
+        return df
+
+    df[TIME_COLUMN] = (
+        pd.to_datetime(df[TIME_COLUMN], errors="coerce", utc=True)
+        .dt.tz_convert(None)        # Convert timestamps to naive datetime (local time, no timezone info)
+    )
+    return df
 
 def melt_activity_data(df: pd.DataFrame, status_callback) -> pd.DataFrame:
     """
     Purpose:
     - Unrolls activity columns (Act[0] to Act[5]) into individual minute-level records.
-    - Groups by device before melting so each device's data is kept together.
+    - Builds the long frame in one vectorized pass (ravel Act block, repeat row values, tile minute offsets).
     - Fills environmental columns across expanded rows.
-    - Sorts output by device first, then time.
-    - Optionally saves the melted DataFrame to disk.
+    - Drops NaN activity readings via a mask on the raveled Act block, so only kept rows are materialized.
+    - Keeps input row order (bin_data orders its output by device and bin, so no row sort is needed).
     """
     if status_callback:
         status_callback("Melting data…")
 
     act_cols = [col for col in df.columns if re.match(r"Act\[\d+]", col)]
-    df[TIME_COLUMN] = pd.to_datetime(df[TIME_COLUMN], errors="coerce", utc=True).dt.tz_convert(None)
-
-    melted_rows = []
-
-    # ✅ Group by device before expanding
-    for device_id, device_df in df.groupby(DELINEATING_COL):
-        for _, row in device_df.iterrows():
-            base_time = row[TIME_COLUMN]
-            for offset in range(len(act_cols)):
-                new_row = {
-                    DELINEATING_COL: device_id,
-                    "Time": base_time - pd.Timedelta(minutes=offset),
-                    "Act": row[f"Act[{offset}]"],
-                    "T": row.get("T", None),
-                    "Light": row.get("Light", None),
-                    "Vbat": row.get("Vbat", None)
-                }
-                melted_rows.append(new_row)
-
-    melted_df = pd.DataFrame(melted_rows)
-    melted_df = melted_df.dropna(subset=["Act"])
-
-    # ✅ Sort by device first, then time
-    melted_df = melted_df.sort_values(by=[DELINEATING_COL, "Time"])
+    ensure_naive_time(df)
+
+    n_rows = len(df)
+    n_acts = len(act_cols)
+    act_order = [f"Act[{offset}]" for offset in range(n_acts)]     #Act[k] is the reading k minutes before the row time
+
+    # ✅ Unpivot in one shot: row-major ravel of the Act block, repeat per-row values, tile minute offsets
+    act_flat = df[act_order].to_numpy().ravel(order="C")
+    keep = ~np.isnan(act_flat)      #NaN readings are dropped here, before any long column is built
+    times = (
+        np.repeat(df[TIME_COLUMN].to_numpy("datetime64[ns]"), n_acts)
+        - np.tile(np.arange(n_acts).astype("timedelta64[m]"), n_rows)
+    )[keep]
+
+    devices = df[DELINEATING_COL]
+    if isinstance(devices.dtype, pd.CategoricalDtype):        #repeat the integer codes, not the labels
+        device_col = pd.Categorical.from_codes(np.repeat(devices.cat.codes.to_numpy(), n_acts)[keep], dtype=devices.dtype)
+    else:
+        device_col = np.repeat(devices.to_numpy(), n_acts)[keep]
+
+    melted = {
+        DELINEATING_COL: device_col,
+        "Time": times,
+        "Act": act_flat[keep],
+    }
+    #Column presence is checked once; missing environmental columns become all-NaN float columns
+    n_kept = int(keep.sum())
+    for env_col in ("T", "Light", "Vbat"):
+        if env_col in df.columns:
+            melted[env_col] = np.repeat(df[env_col].to_numpy(), n_acts)[keep]
+        else:
+            melted[env_col] = np.full(n_kept, np.nan)
+
+    melted_df = pd.DataFrame(melted)
 
     return melted_df
 
@@ -63,66 +94,248 @@ def bin_data(df: pd.DataFrame, interval: str, status_callback) -> pd.DataFrame:
     - pd.DataFrame: Binned DataFrame with summary statistics and time-aligned bins.
     """
 
-    match = re.search(r"(\d+)", interval)       #Parse numeric duration from input string (e.summary_df. "15 minutes")
-    if not match:       #Validate that a numeric duration was found in the interval string
-        raise ValueError(f"Invalid interval format: '{interval}'. Expected a number like '15 minutes'.")
+    step_ns = _interval_step_ns(interval)
 
     if status_callback:
         status_callback(f"Binning data…")
 
+    #Ensure all timestamps are naive and in local timezone
+    ensure_naive_time(df)
 
-    duration_value = float(match.group(1))      #Convert matched number to float (e.g. "15" → 15.0)
+    #Floor timestamps to bin intervals with an integer floor on the raw nanosecond values
+    times = df[TIME_COLUMN].to_numpy("datetime64[ns]")
+    ns = times.view("i8")
+    binned = (ns // step_ns * step_ns).view("datetime64[ns]")
+    df["Bin"] = np.where(np.isnat(times), np.datetime64("NaT"), binned)       #keep unparseable times as NaT
 
-    #Ensure all timestamps are naive and in local timezone
-    df[TIME_COLUMN] = (
-        pd.to_datetime(df[TIME_COLUMN], errors="coerce", utc=True)
-        .dt.tz_convert(None)        # Convert timestamps to naive datetime (local time, no timezone info)
+    agg_spec = _build_agg_spec()
+    if not agg_spec:
+        out = df.copy()
+        out.rename(columns={"Bin": "Time"}, inplace=True)
+        return out
+
+    #Factorize (subject, bin) once and reduce every column against the shared codes
+    grouped = _reduce_by_codes(df, agg_spec)
+    return _summarize(grouped)
+
+def bin_wide(df: pd.DataFrame, interval: str, status_callback=None) -> pd.DataFrame:
+    """
+    Purpose:
+    - Produces the same output as melt_activity_data() followed by bin_data(), without materializing
+      the minute-level long frame.
+    - Act[k] of a row at time t belongs to bin floor(t - k minutes); the row's other columns are counted
+      once per non-NaN Act[k], exactly as the melt would repeat them.
+    - Each offset k is reduced straight from the wide columns and the per-k partials are combined.
+    Args:
+    - df (pd.DataFrame): Wide-format merged data with Act[0]..Act[K-1] columns.
+    - interval (str): Binning interval (e.g. "15 minutes", "1 hour", "1 day").
+    - status_callback (callable, optional): Receives progress messages.
+    Returns:
+    - pd.DataFrame: Binned DataFrame with summary statistics and time-aligned bins.
+    """
+    step_ns = _interval_step_ns(interval)
+
+    if status_callback:
+        status_callback("Binning data…")
+
+    ensure_naive_time(df)
+    agg_spec = _build_agg_spec()
+    if not agg_spec:
+        return bin_data(melt_activity_data(df, status_callback), interval, status_callback)
+
+    n_acts = len([col for col in df.columns if re.match(r"Act\[\d+]", col)])
+    act_mat = df[[f"Act[{offset}]" for offset in range(n_acts)]].to_numpy(dtype=np.float64)
+
+    #Per-row source values; "Act" is filled per offset below, the rest are shared by all offsets
+    value_cols = list(agg_spec)
+    row_values = np.empty((len(df), len(value_cols)))
+    act_j = value_cols.index("Act") if "Act" in value_cols else None
+    for j, col in enumerate(value_cols):
+        if col != "Act":
+            row_values[:, j] = pd.to_numeric(df[col], errors="coerce") if col in df.columns else np.nan
+
+    #Integer group key = subject code * span + bin index, so one sort of the keys orders by subject, then bin
+    device_codes, devices = pd.factorize(df[DELINEATING_COL], sort=True)
+    times = df[TIME_COLUMN].to_numpy("datetime64[ns]")
+    ns = times.view("i8")
+    rows_ok = (device_codes >= 0) & ~np.isnat(times)
+
+    offset_ns = np.arange(n_acts, dtype=np.int64) * 60 * 1_000_000_000
+    if rows_ok.any():
+        first_bin = (ns[rows_ok].min() - offset_ns.max(initial=0)) // step_ns
+        span = ns[rows_ok].max() // step_ns - first_bin + 1
+    else:
+        first_bin, span = 0, 1
+
+    offset_keys, offset_rows = [], []
+    for k in range(n_acts):
+        rows = np.flatnonzero(rows_ok & ~np.isnan(act_mat[:, k]))       #the melt drops rows whose Act is NaN
+        bin_index = (ns[rows] - offset_ns[k]) // step_ns - first_bin
+        offset_keys.append(device_codes[rows].astype(np.int64) * span + bin_index)
+        offset_rows.append(rows)
+    group_keys = np.unique(np.concatenate(offset_keys)) if offset_keys else np.empty(0, dtype=np.int64)
+    n_groups = len(group_keys)
+
+    #Reduce each offset against the shared group space and fold the partials together
+    results = None
+    for k, (keys, rows) in enumerate(zip(offset_keys, offset_rows)):
+        values = row_values[rows]
+        if act_j is not None:
+            values[:, act_j] = act_mat[rows, k]
+        partial = _reduce_values(np.searchsorted(group_keys, keys), values, n_groups, agg_spec)
+        if results is None:
+            results = partial
+        else:
+            results["sum"] += partial["sum"]
+            results["count"] += partial["count"]
+            results["min"] = np.fmin(results["min"], partial["min"])
+            results["max"] = np.fmax(results["max"], partial["max"])
+    if results is None:
+        results = _reduce_values(np.empty(0, dtype=np.int64), row_values[:0], 0, agg_spec)
+
+    index = pd.MultiIndex.from_arrays(
+        [np.asarray(devices)[group_keys // span], ((group_keys % span + first_bin) * step_ns).view("datetime64[ns]")],
+        names=[DELINEATING_COL, "Bin"]
+    )
+    grouped = pd.DataFrame(
+        {(col, reducer): results[reducer][:, j] for j, col in enumerate(value_cols) for reducer in agg_spec[col]},
+        index=index
     )
+    return _summarize(grouped)
+
+def _interval_step_ns(interval: str) -> int:
+    """
+    Purpose:
+    - Parses a binning interval string (e.g. "15 minutes", "1 hour", "1 day") into nanoseconds.
+    """
+    match = re.search(r"(\d+)", interval)       #Parse numeric duration from input string (e.g. "15 minutes")
+    if not match:       #Validate that a numeric duration was found in the interval string
+        raise ValueError(f"Invalid interval format: '{interval}'. Expected a number like '15 minutes'.")
 
-    #Floor timestamps to bin intervals
-    unit = (
-        "D"   if "day"  in interval else
-        "H"   if "hour" in interval else
-        "min"
+    duration_value = float(match.group(1))      #Convert matched number to float (e.g. "15" → 15.0)
+    unit_seconds = (
+        86400 if "day"  in interval else
+        3600  if "hour" in interval else
+        60
     )
-    df["Bin"] = df[TIME_COLUMN].dt.floor(f"{int(duration_value)}{unit}")
+    return int(duration_value) * unit_seconds * 1_000_000_000
 
-    #Initialize summary containers
-    summary = []
+def _build_agg_spec() -> dict:
+    """
+    Purpose:
+    - Maps each configured summary in SELECTED_COLUMNS onto the reducers it needs per source column.
+    Returns:
+    - dict: Source column -> list of reducers ("sum", "count", "min", "max").
+    """
+    needs = {
+        "sum":         ("sum", "count"),
+        "mean":        ("sum", "count"),
+        "act_percent": ("sum", "count"),
+        "max":         ("max",),
+        "min":         ("min",),
+    }
+    agg_spec = {}
+    for cfg in SELECTED_COLUMNS.values():
+        reducers = needs.get(cfg.get("summarize", "mean"), needs["mean"])
+        for col in cfg.get("columns", []):
+            for reducer in reducers:
+                if reducer not in agg_spec.setdefault(col, []):       #dedupe reducers shared across config entries
+                    agg_spec[col].append(reducer)
+    return agg_spec
 
-    #Loop over configured aggregation groups
+def _summarize(grouped: pd.DataFrame) -> pd.DataFrame:
+    """
+    Purpose:
+    - Builds the configured output columns from per-(subject, bin) reducer results.
+    Args:
+    - grouped (pd.DataFrame): Reducer results indexed by (DELINEATING_COL, "Bin") with (column, reducer) columns.
+    Returns:
+    - pd.DataFrame: One row per subject and bin, with the bin start in the "Time" column.
+    """
+    out = pd.DataFrame(index=grouped.index)
     for idx, cfg in SELECTED_COLUMNS.items():
         name = cfg.get("name", f"Bin_{idx}")           #output column name
         cols = cfg.get("columns", [])                  #source columns to aggregate
         agg  = cfg.get("summarize", "mean")            #aggregation method
 
-        def agg_func(subdf: pd.DataFrame) -> float:
-            vals = subdf[cols].to_numpy().ravel()      #flatten all values
-            vals = vals[~np.isnan(vals)]               #drop NaNs
-            if vals.size == 0:
-                return np.nan
-            if agg == "sum":         return np.sum(vals)
-            if agg == "max":         return np.max(vals)
-            if agg == "min":         return np.min(vals)
-            if agg == "act_percent": return np.mean(vals) * 50 + 50
-            return np.mean(vals)
-
-        summary_series = df.groupby([DELINEATING_COL, "Bin"]).apply(agg_func)
-        summary_df = summary_series.reset_index()
-        summary_df.rename(columns={0: name}, inplace=True)
-        summary.append(summary_df)
-
-    #Merge all computed summaries
-    if not summary:
-        out = df.copy()
-    else:
-        out = summary[0]
-        for summary_df in summary[1:]:
-            out = out.merge(summary_df, on=[DELINEATING_COL, "Bin"], how="left")
+        if not cols:
+            out[name] = np.nan
+        elif agg == "max":
+            out[name] = grouped[[(c, "max") for c in cols]].max(axis=1)
+        elif agg == "min":
+            out[name] = grouped[[(c, "min") for c in cols]].min(axis=1)
+        else:
+            #Values are pooled across all source columns, NaNs excluded, as in a flattened reduction
+            total = grouped[[(c, "sum") for c in cols]].sum(axis=1)
+            count = grouped[[(c, "count") for c in cols]].sum(axis=1)
+            total = total.where(count > 0)             #groups with no valid values summarize to NaN
+            if agg == "sum":
+                out[name] = total
+            elif agg == "act_percent":
+                out[name] = total / count * 50 + 50
+            else:
+                out[name] = total / count
+
+    out = out.reset_index()
 
     out.rename(columns={"Bin": "Time"}, inplace=True) #Rename bin column to "Time" for clarity
     return out
 
-def melt_then_bin(df: pd.DataFrame, interval: str, status_callback=None) -> pd.DataFrame:
-    melted = melt_activity_data(df, status_callback)
-    return bin_data(melted, interval, status_callback)
\ No newline at end of file
+def _reduce_by_codes(df: pd.DataFrame, agg_spec: dict) -> pd.DataFrame:
+    """
+    Purpose:
+    - Computes the reducers in `agg_spec` per (subject, bin) against one factorized key array.
+    - Returns a frame shaped like a pandas `groupby().agg(agg_spec)` result so callers can share assembly code.
+    Args:
+    - df (pd.DataFrame): Input DataFrame containing DELINEATING_COL, "Bin" and the source columns.
+    - agg_spec (dict): Mapping of source column -> list of reducers ("sum", "count", "min", "max").
+    Returns:
+    - pd.DataFrame: Reducer results indexed by (DELINEATING_COL, "Bin") with (column, reducer) columns.
+    """
+    keyed = df.loc[df[DELINEATING_COL].notna() & df["Bin"].notna()]       #groupby drops missing keys too
+    keys = pd.MultiIndex.from_arrays([keyed[DELINEATING_COL], keyed["Bin"]])
+    codes, uniques = pd.factorize(keys, sort=True)     #sorting the unique keys orders output by subject, then bin
+    n_groups = len(uniques)
+
+    #One contiguous float64 block, the layout the reduction kernels take
+    value_cols = list(agg_spec)
+    values = np.ascontiguousarray(keyed[value_cols].to_numpy(dtype=np.float64))
+
+    results = _reduce_values(codes, values, n_groups, agg_spec)
+
+    grouped = pd.DataFrame(
+        {(col, reducer): results[reducer][:, j] for j, col in enumerate(value_cols) for reducer in agg_spec[col]},
+        index=uniques.set_names([DELINEATING_COL, "Bin"])
+    )
+    return grouped
+
+def _reduce_values(codes: np.ndarray, values: np.ndarray, n_groups: int, agg_spec: dict) -> dict:
+    """
+    Purpose:
+    - Computes per-group sum, count, min and max of each value column, skipping NaNs.
+    - Uses the compiled kernel in bin/helpers_numba.py when Numba is installed, otherwise
+      np.bincount for sum/count and NaN-ignoring fmin/fmax scatters for min/max.
+    Args:
+    - codes (np.ndarray): Group label per row (0..n_groups-1).
+    - values (np.ndarray): float64 array of shape (rows, len(agg_spec)), columns in agg_spec order.
+    - n_groups (int): Number of groups.
+    - agg_spec (dict): Source column -> reducers, used to skip work nobody asked for.
+    Returns:
+    - dict: Reducer name -> (n_groups, columns) array.
+    """
+    if NUMBA_AVAILABLE:
+        sums, counts, mins, maxs = group_reduce(codes.astype(np.int64), np.ascontiguousarray(values), n_groups)
+        return {"sum": sums, "count": counts, "min": mins, "max": maxs}
+
+    results = {reducer: np.full((n_groups, values.shape[1]), np.nan) for reducer in ("sum", "count", "min", "max")}
+    for j, col in enumerate(agg_spec):
+        vals = values[:, j]
+        valid = ~np.isnan(vals)
+        if "sum" in agg_spec[col] or "count" in agg_spec[col]:
+            results["sum"][:, j] = np.bincount(codes, weights=np.where(valid, vals, 0.0), minlength=n_groups)
+            results["count"][:, j] = np.bincount(codes, weights=valid.astype(np.float64), minlength=n_groups)
+        if "min" in agg_spec[col]:
+            np.fmin.at(results["min"][:, j], codes, vals)      #fmin ignores NaN, so empty groups stay NaN
+        if "max" in agg_spec[col]:
+            np.fmax.at(results["max"][:, j], codes, vals)
+    return results
@@ -0,0 +1,82 @@
+#bin/helpers_numba.py
+
+"""
+Purpose:
+- Provides an optional Numba-compiled group reduction kernel for the binning hot path.
+- Used by bin/helpers.py (_reduce_values) when Numba is installed; without it the same reduction runs in NumPy
+  (np.bincount for sum/count, np.fmin.at / np.fmax.at for min/max).
+"""
+
+import os
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:     #Numba is optional; callers check NUMBA_AVAILABLE
+    njit = prange = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def group_reduce(codes: np.ndarray, values: np.ndarray, n_groups: int):
+    """
+    Purpose:
+    - Computes per-group sum, count, min and max for every value column in one linear pass.
+    - NaN values are skipped; groups with no valid values report NaN for min/max.
+    Args:
+    - codes (np.ndarray): int64 group label per row (0..n_groups-1).
+    - values (np.ndarray): Contiguous float64 array of shape (rows, columns).
+    - n_groups (int): Number of distinct groups.
+    Returns:
+    - tuple[np.ndarray, ...]: (sums, counts, mins, maxs), each shaped (n_groups, columns).
+    """
+    n_chunks = max(1, min(os.cpu_count() or 1, len(codes) // 100_000))
+    return _group_reduce(codes, values, n_groups, n_chunks)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _group_reduce(codes, values, n_groups, n_chunks):
+        n_rows, n_cols = values.shape
+
+        #Per-chunk output buffers so threads never write to the same slot (no atomics needed)
+        sums = np.zeros((n_chunks, n_groups, n_cols))
+        cnts = np.zeros((n_chunks, n_groups, n_cols))
+        mins = np.full((n_chunks, n_groups, n_cols), np.inf)
+        maxs = np.full((n_chunks, n_groups, n_cols), -np.inf)
+
+        step = (n_rows + n_chunks - 1) // n_chunks
+        for chunk in prange(n_chunks):
+            lo = chunk * step
+            hi = min(lo + step, n_rows)
+            for i in range(lo, hi):
+                g = codes[i]
+                for j in range(n_cols):
+                    v = values[i, j]
+                    if np.isnan(v):
+                        continue
+                    sums[chunk, g, j] += v
+                    cnts[chunk, g, j] += 1
+                    if v < mins[chunk, g, j]:
+                        mins[chunk, g, j] = v
+                    if v > maxs[chunk, g, j]:
+                        maxs[chunk, g, j] = v
+
+        #Fold the per-chunk buffers together
+        out_sum = sums.sum(axis=0)
+        out_cnt = cnts.sum(axis=0)
+        out_min = np.full((n_groups, n_cols), np.nan)
+        out_max = np.full((n_groups, n_cols), np.nan)
+        for g in range(n_groups):
+            for j in range(n_cols):
+                if out_cnt[g, j] > 0:
+                    lo_v = np.inf
+                    hi_v = -np.inf
+                    for chunk in range(n_chunks):
+                        lo_v = min(lo_v, mins[chunk, g, j])
+                        hi_v = max(hi_v, maxs[chunk, g, j])
+                    out_min[g, j] = lo_v
+                    out_max[g, j] = hi_v
+        return out_sum, out_cnt, out_min, out_max
+else:
+    _group_reduce = None
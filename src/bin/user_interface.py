@@ -18,7 +18,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QFontMetrics
 from PyQt6.QtCore import Qt, QDate, pyqtSignal
-from bin.workers import BinningWorker
+from bin.workers import BinningWorker, PYARROW_AVAILABLE
 
 class BinningPanel(QGroupBox):
     """
@@ -132,6 +132,12 @@ class BinningPanel(QGroupBox):
             h_bin.addWidget(rb)
         layout.addWidget(bin_box)
 
+        #Output format: Parquet when pyarrow is installed, with an optional CSV copy for spreadsheet users
+        self.csv_copy_cb = QCheckBox("Also save CSV copy", self)
+        self.csv_copy_cb.setChecked(True)
+        self.csv_copy_cb.setVisible(PYARROW_AVAILABLE) #Without pyarrow the output is always CSV
+        layout.addWidget(self.csv_copy_cb)
+
         #Submit + spinner
         self.btn_bin = QPushButton("Submit", self) #submit button
         self.btn_bin.setEnabled(False) #disable at start (until file is loaded)
@@ -238,7 +244,7 @@ class BinningPanel(QGroupBox):
         """
         Purpose:
         - Handles successful completion of the binning worker.
-        - Saves the output to Excel, emits the file path, and shows a success message.
+        - Saves the output to Parquet (plus an optional CSV copy) or CSV, emits the file path, and shows a success message.
         """
         self.bin_progress.hide() #hide progress bar
         self.btn_bin.show() #reshow button
@@ -247,9 +253,16 @@ class BinningPanel(QGroupBox):
         try:
             export_dir = os.path.dirname(self.bin_file)
             os.makedirs(export_dir, exist_ok=True)
-            file_name = f"binned_{interval.replace(' ', '_')}.csv" #generate file name
-            display_path = os.path.normpath(os.path.join(export_dir, file_name)) #generate filepath
-            out_df.to_csv(display_path, index=False) #Save filepath
+            stem = os.path.join(export_dir, f"binned_{interval.replace(' ', '_')}") #generate file name
+            csv_path = os.path.normpath(f"{stem}.csv")
+            if PYARROW_AVAILABLE:
+                display_path = os.path.normpath(f"{stem}.parquet") #columnar binary; much faster to write and reload
+                out_df.to_parquet(display_path, engine="pyarrow", compression="zstd", index=False)
+                if self.csv_copy_cb.isChecked():
+                    out_df.to_csv(csv_path, index=False)
+            else:
+                display_path = csv_path
+                out_df.to_csv(display_path, index=False) #Save filepath
             self.binned_filepath.emit(display_path)
 
             QMessageBox.information(
@@ -10,10 +10,53 @@ Works with:
 """
 
 import os
+import datetime as dt
+import numpy as np
 import pandas as pd
 from PyQt6.QtCore import QThread, pyqtSignal, QDate, QTime
-from bin.helpers import melt_then_bin
-from config import (TIME_COLUMN, SELECTED_COLUMNS)
+from bin.helpers import bin_wide, ensure_naive_time
+from config import (TIME_COLUMN, SELECTED_COLUMNS, DELINEATING_COL)
+
+try:
+    import pyarrow  #Optional; enables pandas' multi-threaded pyarrow CSV engine
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+CHUNK_ROWS = 200_000  #Rows per read_csv chunk when streaming the input file
+
+_READ_CACHE = {}  #(path, mtime, bounds) -> trimmed DataFrame from the most recent run; never mutated after caching
+
+
+def _parquet_copy(path: str) -> str | None:
+    """
+    Purpose:
+    - Returns the Parquet copy the merge step writes beside its CSV (same stem), if it exists and is
+      at least as new as `path`; otherwise None.
+    """
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    if parquet_path == path or not os.path.exists(parquet_path):
+        return None
+    return parquet_path if os.path.getmtime(parquet_path) >= os.path.getmtime(path) else None
+
+
+def _trim_to_bounds(df: pd.DataFrame, start_dt, end_dt) -> pd.DataFrame:
+    """
+    Purpose:
+    - Keeps rows whose TIME_COLUMN falls within [start_dt, end_dt].
+    - Time-ordered input is cut with two binary searches and one positional slice;
+      otherwise (e.g. several subjects stacked one after another) a boolean mask is used.
+    """
+    times = df[TIME_COLUMN].to_numpy("datetime64[ns]")
+    if np.all(times[1:] >= times[:-1]): #NaT compares False, so unparsed times take the mask path
+        lo = np.searchsorted(times, np.datetime64(start_dt, "ns"), side="left")
+        hi = np.searchsorted(times, np.datetime64(end_dt, "ns"), side="right")
+        return df.iloc[lo:hi]
+
+    return df.loc[
+        (df[TIME_COLUMN] >= start_dt) &
+        (df[TIME_COLUMN] <= end_dt)
+        ]
 
 
 class BinningWorker(QThread):
@@ -62,44 +105,96 @@ class BinningWorker(QThread):
         - Emits the final binned DataFrame or an error message.
         """
         try:
-            self.status_callback("Reading Data…")
-            df = pd.read_csv(self.file_path) #Load input dataset
-
-            #Ensure timestamps are naive (no timezone info)
-            df[TIME_COLUMN] = (
-                pd.to_datetime(df[TIME_COLUMN], errors="coerce", utc=True)
-                .dt.tz_convert(None)
-            )
-
-            if not self.already_trimmed: #Trim dataset by start/end time if bounding is enabled
-                import datetime as dt
-
-                start_hour = (self.start_time.hour() % 12) + (12 if self.start_pm else 0) #Construct start datetime (convert 12hr to 24hr if needed)
-                start_dt = dt.datetime(
-                    self.start_date.year(),
-                    self.start_date.month(),
-                    self.start_date.day(),
-                    start_hour,
-                    self.start_time.minute()
-                )
-
-                end_hour = (self.end_time.hour() % 12) + (12 if self.end_pm else 0)#Construct end datetime (convert 12hr to 24hr if needed)
-                end_dt = dt.datetime(
-                    self.end_date.year(),
-                    self.end_date.month(),
-                    self.end_date.day(),
-                    end_hour,
-                    self.end_time.minute()
-                )
-
-                #Filter rows within the user-defined time range
-                df = df.loc[
-                    (df[TIME_COLUMN] >= start_dt) &
-                    (df[TIME_COLUMN] <= end_dt)
-                    ]
-
-            binned_df = melt_then_bin(df, self.interval, status_callback=self.status.emit) #Execute binning logic using helper
+            bounds = None if self.already_trimmed else self._time_bounds() #Trim dataset by start/end time if bounding is enabled
+
+            #Reuse the trimmed data when only the interval changed since the last run
+            key = (self.file_path, os.path.getmtime(self.file_path), bounds)
+            df = _READ_CACHE.get(key)
+            if df is None:
+                df = self._load_trimmed(bounds)
+                _READ_CACHE.clear() #Keep only the most recent entry so old frames are released
+                _READ_CACHE[key] = df
+            else:
+                self.status_callback("Reusing loaded data…")
+
+            binned_df = bin_wide(df, self.interval, status_callback=self.status.emit) #Bin straight from the wide Act[i] columns (no melt)
             self.finished.emit(binned_df)  #Emit result to UI
 
         except Exception as error:
-            self.errored.emit(str(error))  #Emit error message to UI
\ No newline at end of file
+            self.errored.emit(str(error))  #Emit error message to UI
+
+    def _load_trimmed(self, bounds):
+        """
+        Purpose:
+        - Reads the input file, trims it to `bounds` and prepares it for binning.
+        Args:
+        - bounds (tuple[datetime, datetime] | None): Start/end datetimes, or None when already trimmed.
+        Returns:
+        - pd.DataFrame: Trimmed and consolidated wide-format data.
+        """
+        #Stream the file in chunks and trim each one, so peak memory is one chunk plus the survivors
+        self.status_callback("Reading Data…")
+        parts = []
+        rows_read = 0
+        for chunk in self._read_chunks():
+            rows_read += len(chunk)
+            ensure_naive_time(chunk) #Ensure timestamps are naive (no timezone info); parsed once for the whole pipeline
+            if bounds is not None: #Filter rows within the user-defined time range
+                chunk = _trim_to_bounds(chunk, *bounds)
+            parts.append(chunk)
+            self.status_callback(f"Reading Data… ({rows_read:,} rows)")
+
+        if not parts:
+            raise RuntimeError("No data read; check your merged file.")
+        df = pd.concat(parts, copy=False)
+        if len(parts) > 1:
+            df = df.copy() #Consolidate into one block per dtype so binning doesn't walk fragmented blocks
+
+        df[DELINEATING_COL] = df[DELINEATING_COL].astype("category") #integer codes make the (subject, bin) keys cheap to factorize
+        return df
+
+    def _read_chunks(self):
+        """
+        Purpose:
+        - Yields the input file as DataFrames for _load_trimmed() to trim.
+        - Uses pyarrow's multi-threaded CSV reader in one pass when it is installed
+          (it cannot stream chunks); otherwise streams CHUNK_ROWS chunks with the C engine.
+        - With pyarrow, an up-to-date Parquet copy of the file (see merge/helpers.save_merged) is read instead;
+          its Time column is left as text for ensure_naive_time() to parse.
+        """
+        if PYARROW_AVAILABLE:
+            parquet_path = _parquet_copy(self.file_path)
+            if parquet_path is not None:
+                yield pd.read_parquet(parquet_path)
+                return
+            yield pd.read_csv(self.file_path, engine="pyarrow", parse_dates=[TIME_COLUMN])
+            return
+
+        with pd.read_csv(self.file_path, parse_dates=[TIME_COLUMN], chunksize=CHUNK_ROWS) as reader:
+            yield from reader
+
+    def _time_bounds(self):
+        """
+        Purpose:
+        - Builds the user-selected start/end datetimes (12hr controls converted to 24hr).
+        Returns:
+        - tuple[datetime, datetime]: (start_dt, end_dt) used to trim the dataset.
+        """
+        start_hour = (self.start_time.hour() % 12) + (12 if self.start_pm else 0) #Construct start datetime (convert 12hr to 24hr if needed)
+        start_dt = dt.datetime(
+            self.start_date.year(),
+            self.start_date.month(),
+            self.start_date.day(),
+            start_hour,
+            self.start_time.minute()
+        )
+
+        end_hour = (self.end_time.hour() % 12) + (12 if self.end_pm else 0)#Construct end datetime (convert 12hr to 24hr if needed)
+        end_dt = dt.datetime(
+            self.end_date.year(),
+            self.end_date.month(),
+            self.end_date.day(),
+            end_hour,
+            self.end_time.minute()
+        )
+        return start_dt, end_dt
\ No newline at end of file
@@ -8,11 +8,277 @@ Purpose:
 """
 
 import os
+import warnings
+import threading
+from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
+from graph.helpers_numba import NUMBA_AVAILABLE, m4_picks
 
+_BASE_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd')   # series colors, cycled by position
+_ANN_FONT = dict(family="Arial", size=18, color="black")                 # row label font, shared by every annotation
+M4_BUCKETS = 1000   # ~ figure width in pixels; longer series are reduced to at most 4 points per bucket
+_SANITIZE = str.maketrans({" ": "_", "/": "_"})   # filename-unsafe characters -> "_"
+MAX_FILENAME_STEM = 200   # keeps generated export names under common 255-byte filesystem limits
+PARALLEL_MIN_DATASETS = 4 # mult_sub_plot extracts series on a thread pool from this many datasets up
+MAX_TRACE_WORKERS = 8
+PLOT_CACHE_SIZE = 8 # completed figures kept by _cached_figure (oldest evicted first)
+
+_PLOT_CACHE = {}    # (function, id(df), args...) -> (df, fig); df is held so its id can't be reused while cached
+_PLOT_CACHE_LOCK = threading.Lock()
+
+def read_data_file(path: str, **csv_kwargs) -> pd.DataFrame:
+    """
+    Purpose:
+    - Loads a graphing data file, dispatching on extension.
+    - Parquet files (written by the binning step when pyarrow is installed) are read with pd.read_parquet;
+      anything else is treated as CSV.
+    Args:
+    - path (str): File path to load.
+    - csv_kwargs: Extra keyword arguments forwarded to pd.read_csv.
+    Returns:
+    - pd.DataFrame: Loaded data.
+    """
+    if path.lower().endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, **csv_kwargs)
+
+def clear_plot_cache():
+    """
+    Purpose:
+    - Drops every cached figure (and the DataFrames they hold). Call when the plotted data changes:
+      after loading a new file, or after mutating a DataFrame in place that was already plotted,
+      since cache hits are keyed on the DataFrame's identity, not its contents.
+    """
+    with _PLOT_CACHE_LOCK:
+        _PLOT_CACHE.clear()
+
+def _figure_from(cached: "FigureDict", as_dict: bool):
+    """
+    Purpose:
+    - Hands out a fresh figure built from a cached FigureDict, so callers can tweak what they get
+      without touching the cache or each other.
+    Returns:
+    - go.Figure | FigureDict: A new go.Figure, or (as_dict=True) a FigureDict with its own trace and
+      layout dicts; nested values are shared read-only.
+    """
+    if as_dict:
+        fig = FigureDict(data=[dict(t) for t in cached["data"]], layout=dict(cached["layout"]))
+    else:
+        fig = go.Figure(cached)
+    fig._filename = cached._filename
+    return fig
+
+def _cached_figure(plot_fn):
+    """
+    Purpose:
+    - Memoizes a plot helper on (DataFrame identity, remaining arguments) so unchanged plots skip
+      the whole build.
+    - Only the plain dict form is cached (as_dict is left out of the key); every call, hit or miss,
+      gets its own go.Figure or FigureDict built from it by _figure_from().
+    - A `groups` keyword is left out of the key too: it only indexes df, so it can't change the result.
+    """
+    @wraps(plot_fn)
+    def wrapper(df, *args, as_dict=False, **kwargs):
+        freeze = lambda a: tuple(a) if isinstance(a, list) else a
+        key = (plot_fn.__name__, id(df),
+               tuple(freeze(a) for a in args),
+               tuple(sorted((k, freeze(v)) for k, v in kwargs.items() if k != "groups")))
+        with _PLOT_CACHE_LOCK:
+            hit = _PLOT_CACHE.get(key)
+        if hit is not None and hit[0] is df:
+            return _figure_from(hit[1], as_dict)
+
+        cached = plot_fn(df, *args, **kwargs)
+        with _PLOT_CACHE_LOCK:
+            _PLOT_CACHE[key] = (df, cached)
+            while len(_PLOT_CACHE) > PLOT_CACHE_SIZE:
+                del _PLOT_CACHE[next(iter(_PLOT_CACHE))]
+        return _figure_from(cached, as_dict)
+    return wrapper
+
+def _m4_index(y: np.ndarray, n_buckets: int = M4_BUCKETS):
+    """
+    Purpose:
+    - M4 downsampling: splits the series into `n_buckets` consecutive index buckets and picks
+      the first, last, min and max point of each, which draws the same line at plot resolution.
+    - Uses the compiled kernel in graph/helpers_numba.py when Numba is installed, otherwise
+      argmin/argmax over a NaN-padded (buckets, size) view.
+    Args:
+    - y (np.ndarray): Numeric y values; NaN points are never picked as min/max.
+    Returns:
+    - np.ndarray | None: Sorted row positions to keep, or None when the series has at most
+      4 * n_buckets points and should be plotted whole.
+    """
+    n = len(y)
+    if n <= 4 * n_buckets:
+        return None
+
+    size = -(-n // n_buckets)            # ceil division; the last bucket may be short
+    n_buckets = -(-n // size)
+    if NUMBA_AVAILABLE and y.dtype.kind == 'f':
+        return np.unique(m4_picks(np.ascontiguousarray(y), size, n_buckets))
+
+    padded = np.full(n_buckets * size, np.nan, dtype=y.dtype)
+    padded[:n] = y
+    blocks = padded.reshape(n_buckets, size)
+    nan = np.isnan(blocks)
+
+    first = np.arange(n_buckets) * size
+    last = np.minimum(first + size - 1, n - 1)
+    lo = np.where(nan, np.inf, blocks).argmin(axis=1) + first    # all-NaN buckets fall back to `first`
+    hi = np.where(nan, -np.inf, blocks).argmax(axis=1) + first
+    return np.unique(np.concatenate([first, lo, hi, last]))
+
+def _m4_downsample(x: np.ndarray, y: np.ndarray, n_buckets: int = M4_BUCKETS):
+    """
+    Purpose:
+    - Applies _m4_index() to an (x, y) series.
+    Returns:
+    - tuple[np.ndarray, np.ndarray]: The kept (x, y) points in original order (the inputs
+      themselves when no downsampling is needed).
+    """
+    keep = _m4_index(y, n_buckets)
+    if keep is None:
+        return x, y
+    return x[keep], y[keep]
+
+def _safe(s: str) -> str:
+    """
+    Purpose:
+    - Makes a label filename-safe (spaces and slashes become underscores) in one str.translate pass.
+    """
+    return s.translate(_SANITIZE)
+
+def _export_name(stem: str) -> str:
+    """
+    Purpose:
+    - Builds the .html export filename for a figure, truncating very long stems.
+    """
+    return f"{stem[:MAX_FILENAME_STEM]}.html"
+
+def sing_sub_plot_filename(title_text: str, x_axis: str, y_axes: list[str]) -> str:
+    """
+    Purpose:
+    - Export filename sing_sub_plot() gives its figure, available without building it.
+    """
+    y_part = "_".join(_safe(col) for col in y_axes)
+    return _export_name(f"{_safe(title_text)}_{_safe(x_axis)}_{y_part}")
+
+def mult_sub_plot_filename(column: str, selected_ds: list[str]) -> str:
+    """
+    Purpose:
+    - Export filename mult_sub_plot() gives its figure, available without building it.
+    """
+    return _export_name(f"{_safe(column)}_across_{_safe('_'.join(selected_ds))}")
+
+def _row_label(row: int, text: str) -> dict:
+    """
+    Purpose:
+    - Builds the rotated label annotation drawn left of subplot `row`.
+    """
+    return dict(
+        xref="paper", yref="y domain" if row == 1 else f"y{row} domain",
+        x=-0.10, y=0.5, xanchor="right",
+        text=text, showarrow=False,
+        textangle=-90,
+        font=_ANN_FONT
+    )
+
+def _figure_style(title_text: str, total_rows: int, annotations: list) -> dict:
+    """
+    Purpose:
+    - Returns the shared title, sizing, font and legend layout used by every figure in this module.
+    """
+    return dict(
+        title=dict(text=title_text, x=0.5, font=dict(size=16)),
+        width=1000,
+        height=200 * total_rows,
+        margin=dict(l=200, r=20, t=50, b=40),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(family="Arial", size=12, color="#1a2a3a"),
+        annotations=annotations,
+        showlegend=True,
+        legend=dict(
+            bgcolor="rgba(255,255,255,0.8)",
+            bordercolor="#cccccc", borderwidth=1
+        )
+    )
+
+class FigureDict(dict):
+    """
+    Purpose:
+    - A figure as a plain {"data": [...], "layout": {...}} dict, returned by the plot helpers with as_dict=True.
+    - Subclasses dict only so it can carry the same `_filename` export name a go.Figure does.
+    """
+
+def _axis_name(kind: str, row: int) -> str:
+    """
+    Purpose:
+    - Axis id traces and anchors use for subplot `row` ("x", "y2", ...).
+    """
+    return kind if row == 1 else f"{kind}{row}"
+
+def _axis_key(kind: str, row: int) -> str:
+    """
+    Purpose:
+    - Layout key of subplot `row`'s axis ("xaxis", "yaxis2", ...).
+    """
+    return f"{kind}axis" if row == 1 else f"{kind}axis{row}"
+
+def _subplot_grid(total_rows: int, spacing: float = 0.05) -> dict:
+    """
+    Purpose:
+    - Axis layout for a single-column grid with shared x-axes, domain-for-domain what
+      make_subplots(rows=total_rows, cols=1, shared_xaxes=True, vertical_spacing=spacing)
+      produces, without building a figure.
+    Returns:
+    - dict: xaxis{i}/yaxis{i} layout entries, row 1 at the top.
+    """
+    h = (1.0 - spacing * (total_rows - 1)) / total_rows
+    bottom = _axis_name("x", total_rows)
+    grid = {}
+    for row in range(1, total_rows + 1):
+        below = total_rows - row
+        y0 = sum([h] * below) + below * spacing     # summed like make_subplots so the floats match
+        xaxis = dict(anchor=_axis_name("y", row), domain=[0.0, 1.0])
+        if row < total_rows:
+            xaxis.update(matches=bottom, showticklabels=False)
+        grid[_axis_key("x", row)] = xaxis
+        grid[_axis_key("y", row)] = dict(anchor=_axis_name("x", row), domain=[max(0.0, y0), min(1.0, y0 + h)])
+    return grid
+
+def _assemble(traces: list, rows: list, axis_layout: dict, style: dict, filename: str) -> FigureDict:
+    """
+    Purpose:
+    - Places each trace on its row's axes, merges the per-row axis settings into the subplot grid
+      and returns the finished figure.
+    - Everything is assembled as plain dicts; plotly validates it at most once, when _cached_figure
+      turns it into a go.Figure.
+    Returns:
+    - FigureDict: The figure (with the default template, as go.Figure would render it) and `_filename` set.
+    """
+    total_rows = max(rows)
+    for trace, row in zip(traces, rows):
+        trace["xaxis"] = _axis_name("x", row)
+        trace["yaxis"] = _axis_name("y", row)
+
+    layout = _subplot_grid(total_rows)
+    for key, settings in axis_layout.items():
+        layout[key].update(settings)
+    layout.update(style)
+
+    layout["template"] = pio.templates[pio.templates.default].to_plotly_json()
+    fig = FigureDict(data=traces, layout=layout)
+    fig._filename = filename
+    return fig
+
+@_cached_figure
 def sing_sub_plot(df, x_axis, y_axes, title_text):
     """
     Purpose:
@@ -24,118 +290,98 @@ def sing_sub_plot(df, x_axis, y_axes, title_text):
     - x_axis (str): Column to use as x-axis (usually timestamps or measurements).
     - y_axes (list[str]): Columns to plot individually and in normalized combination.
     - title_text (str): Title to display above the entire figure.
+    - as_dict (bool): Return a FigureDict instead of a go.Figure (for writing straight to disk); handled by _cached_figure.
     Returns:
-    - go.Figure: Fully styled Plotly figure with internal filename for export.
+    - go.Figure | FigureDict: Fully styled Plotly figure with internal filename for export.
     """
-    df = df.copy()
-    for col in y_axes:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+    # pull only the plotted columns out as arrays; the caller's frame is never copied or written to
+    x_vals = df[x_axis].to_numpy()
+    y_df = df[y_axes]
+    # only columns that aren't numeric yet (e.g. read with na_filter=False) need parsing
+    non_numeric = [col for col in y_axes if not pd.api.types.is_numeric_dtype(y_df[col])]
+    if non_numeric:
+        y_df = y_df.assign(**y_df[non_numeric].apply(pd.to_numeric, errors='coerce'))
+    y_arr = y_df.to_numpy(dtype=np.float32)     # float32 halves the trace payload; ample for .2f ticks
+
+    filename = sing_sub_plot_filename(title_text, x_axis, y_axes)
 
     n = len(y_axes)
     has_combined = n > 1
     total_rows = n + (1 if has_combined else 0)
 
-    fig = make_subplots(
-        rows=total_rows, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.05
-    )
+    # traces, their rows and axis settings are collected as plain dicts and assembled once
+    traces, rows, axis_layout = [], [], {}
+
+    # M4 row picks are made once per column and shared by its individual and combined traces, so both
+    # reference one x array (min-max scaling is monotonic, so the raw picks stay valid after it)
+    picks = [_m4_index(y_arr[:, j]) for j in range(n)]
+    x_by_col = [x_vals if keep is None else x_vals[keep] for keep in picks]
 
-    base_colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-    cmap = {col: base_colors[i % len(base_colors)]
-            for i, col in enumerate(y_axes)}
+    def column_values(arr, j):
+        return arr[:, j] if picks[j] is None else arr[picks[j], j]
 
     # 1) individual subplots
     for i, col in enumerate(y_axes, start=1):
-        fig.add_trace(
-            go.Scatter(
-                x=df[x_axis], y=df[col],
-                mode='lines', name=col,
-                line=dict(color=cmap[col]),
-                legendgroup=col
-            ),
-            row=i, col=1
-        )
-        fig.update_yaxes(
+        traces.append(dict(
+            type='scatter',
+            x=x_by_col[i - 1], y=column_values(y_arr, i - 1),
+            mode='lines', name=col,
+            line=dict(color=_BASE_COLORS[(i - 1) % len(_BASE_COLORS)]),
+            legendgroup=col
+        ))
+        rows.append(i)
+        axis_layout[_axis_key("y", i)] = dict(
             type='linear', tickformat=".2f",
-            automargin=True, title_standoff=30,
-            row=i, col=1
+            automargin=True, title=dict(standoff=30)
         )
 
     # 2) combined normalized subplot (only if >1 series)
     if has_combined:
-        norm_df = pd.DataFrame({x_axis: df[x_axis]})
-        for col in y_axes:
-            mn, mx = df[col].min(), df[col].max()
-            if mx > mn:
-                norm_df[col] = (df[col] - mn) / (mx - mn)
-            else:
-                norm_df[col] = 0
-
-        for col in y_axes:
-            fig.add_trace(
-                go.Scatter(
-                    x=norm_df[x_axis], y=norm_df[col],
-                    mode='lines', name=col,
-                    line=dict(color=cmap[col]),
-                    legendgroup=col,
-                    showlegend=False
-                ),
-                row=total_rows, col=1
-            )
-        fig.update_yaxes(
-            title="Normalized (0–1)",
-            automargin=True, row=total_rows, col=1
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)     # all-NaN columns
+            mn = np.nanmin(y_arr, axis=0)
+            mx = np.nanmax(y_arr, axis=0)
+        rng = mx - mn
+
+        # series whose spans overlap and whose ranges are within 2x already share a scale,
+        # so the raw values are overlaid as-is and the rescale pass is skipped
+        if np.all(rng > 0) and rng.max() < 2.0 * rng.min() and mn.max() <= mx.min():
+            combined, combined_title = y_arr, "Raw (shared scale)"
+        else:
+            # min-max scale every column in one broadcasted pass; flat or empty columns become 0
+            safe_rng = np.where(rng > 0, rng, 1.0)
+            combined = np.where(rng > 0, (y_arr - mn) / safe_rng, 0.0)
+            combined_title = "Normalized (0–1)"
+
+        for j, col in enumerate(y_axes):
+            traces.append(dict(
+                type='scatter',
+                x=x_by_col[j], y=column_values(combined, j),
+                mode='lines', name=col,
+                line=dict(color=_BASE_COLORS[j % len(_BASE_COLORS)]),
+                legendgroup=col,
+                showlegend=False
+            ))
+            rows.append(total_rows)
+        axis_layout[_axis_key("y", total_rows)] = dict(
+            title=dict(text=combined_title),
+            automargin=True
         )
 
     # 3) x-ticks on every row
     for i in range(1, total_rows + 1):
-        fig.update_xaxes(showticklabels=True, row=i, col=1)
+        axis_layout[_axis_key("x", i)] = dict(showticklabels=True)
 
     # 4) annotations
-    annotations = []
-    for i, col in enumerate(y_axes, start=1):
-        yref = "y domain" if i == 1 else f"y{i} domain"
-        annotations.append(dict(
-            xref="paper", yref=yref,
-            x=-0.10, y=0.5, xanchor="right",
-            text=col, showarrow=False,
-            textangle=-90,
-            font=dict(family="Arial", size=18, color="black")
-        ))
-    if has_combined:
-        yref = f"y{total_rows} domain"
-        annotations.append(dict(
-            xref="paper", yref=yref,
-            x=-0.10, y=0.5, xanchor="right",
-            text="Combined", showarrow=False,
-            textangle=-90,
-            font=dict(family="Arial", size=18, color="black")
-        ))
+    labels = list(y_axes) + (["Combined"] if has_combined else [])
+    annotations = [_row_label(i, text) for i, text in enumerate(labels, start=1)]
 
-    # 5) layout
-    fig.update_layout(
-        title=dict(text=title_text, x=0.5, font=dict(size=16)),
-        width=1000,
-        height=200 * total_rows,
-        margin=dict(l=200, r=20, t=50, b=40),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Arial", size=12, color="#1a2a3a"),
-        annotations=annotations,
-        showlegend=True,
-        legend=dict(
-            bgcolor="rgba(255,255,255,0.8)",
-            bordercolor="#cccccc", borderwidth=1
-        )
-    )
-
-    safe = lambda s: s.replace(" ", "_").replace("/", "_")
-    y_part = "_".join(safe(col) for col in y_axes)
-    fig._filename = f"{safe(title_text)}_{safe(x_axis)}_{y_part}.html"
-    return fig
+    # 5) grid, axes, annotations and styling are assembled in one pass
+    return _assemble(traces, rows, axis_layout, _figure_style(title_text, total_rows, annotations),
+                     filename)
 
-def mult_sub_plot(df, x_axis, column, selected_ds):
+@_cached_figure
+def mult_sub_plot(df, x_axis, column, selected_ds, groups=None):
     """
     Purpose:
     - Plots the same `column` across multiple datasets in separate subplots.
@@ -146,118 +392,99 @@ def mult_sub_plot(df, x_axis, column, selected_ds):
     - x_axis (str): Column to use as x-axis (e.g. 'Time', 'Sample', etc.).
     - column (str): Target column to visualize across datasets.
     - selected_ds (list[str]): List of dataset labels to include (from 'Dataset' column).
+    - as_dict (bool): Return a FigureDict instead of a go.Figure (for writing straight to disk); handled by _cached_figure.
+    - groups (dict[str, np.ndarray], optional): Dataset name -> row positions in df, built once by the caller
+      so repeated calls skip scanning the 'Dataset' column.
     Returns:
-    - go.Figure: Annotated Plotly figure ready for export or embedding.
+    - go.Figure | FigureDict: Annotated Plotly figure ready for export or embedding.
     """
-    df = df.copy()
-    df[column] = pd.to_numeric(df[column], errors='coerce')
+    # only the selected rows of the x and plotted columns are pulled out, as flat arrays
+    no_rows = np.empty(0, dtype=np.intp)
+    if groups is not None:
+        # gather straight from the caller's row positions; each dataset becomes a contiguous run
+        parts = [np.asarray(groups.get(ds, no_rows), dtype=np.intp) for ds in selected_ds]
+        selected = np.concatenate(parts) if parts else no_rows
+        bounds = np.cumsum([0] + [len(p) for p in parts])
+        idx_map = {ds: np.arange(bounds[k], bounds[k + 1]) for k, ds in enumerate(selected_ds)}
+        x_all = df[x_axis].to_numpy().take(selected)
+        y_all = pd.to_numeric(df[column].take(selected), errors='coerce').to_numpy(dtype=np.float32)
+    else:
+        datasets = df['Dataset'].astype('category')     # one factorize; isin and groupby then work on integer codes
+        selected = datasets.isin(selected_ds).to_numpy()
+        ds_col = datasets[selected]
+        x_all = df[x_axis].to_numpy()[selected]
+        y_all = pd.to_numeric(df[column][selected], errors='coerce').to_numpy(dtype=np.float32)
+        # one hash partition into row positions per dataset, reused by both trace loops
+        idx_map = ds_col.groupby(ds_col, sort=False, observed=True).indices
 
     n = len(selected_ds)
     has_combined = n > 1
     total_rows = n + (1 if has_combined else 0)
 
-    fig = make_subplots(
-        rows=total_rows, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.05
-    )
+    # traces, their rows and axis settings are collected as plain dicts and assembled once
+    traces, rows, axis_layout = [], [], {}
 
-    base_colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-    cmap = {ds: base_colors[i % len(base_colors)]
-            for i, ds in enumerate(selected_ds)}
+    # per-dataset gather + downsample is independent NumPy work, so many datasets share a thread pool
+    def extract(ds):
+        ix = idx_map.get(ds, no_rows)
+        return _m4_downsample(x_all.take(ix), y_all.take(ix))
 
-    # individual subject plots
-    for i, ds in enumerate(selected_ds, start=1):
-        sub = df[df['Dataset'] == ds]
-        fig.add_trace(
-            go.Scatter(
-                x=sub[x_axis], y=sub[column],
-                mode='lines', name=ds,
-                line=dict(color=cmap[ds]),
-                legendgroup=ds
-            ),
-            row=i, col=1
-        )
-        fig.update_yaxes(
+    n_workers = min(os.cpu_count() or 1, MAX_TRACE_WORKERS, n)
+    if n >= PARALLEL_MIN_DATASETS and n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            extracted = list(pool.map(extract, selected_ds))    #map keeps dataset order
+    else:
+        extracted = [extract(ds) for ds in selected_ds]
+
+    # individual subject plots; the extracted arrays are kept for the combined subplot
+    series = {}
+    for i, (ds, (xv, yv)) in enumerate(zip(selected_ds, extracted), start=1):
+        series[ds] = (xv, yv)
+        traces.append(dict(
+            type='scatter',
+            x=xv, y=yv,
+            mode='lines', name=ds,
+            line=dict(color=_BASE_COLORS[(i - 1) % len(_BASE_COLORS)]),
+            legendgroup=ds
+        ))
+        rows.append(i)
+        axis_layout[_axis_key("y", i)] = dict(
             type='linear', tickformat=".2f",
-            automargin=True, row=i, col=1
+            automargin=True
         )
 
     # combined subplot at bottom (raw values)
     if has_combined:
-        for ds in selected_ds:
-            sub = df[df['Dataset'] == ds]
-            fig.add_trace(
-                go.Scatter(
-                    x=sub[x_axis], y=sub[column],
-                    mode='lines', name=ds,
-                    line=dict(color=cmap[ds]),
-                    legendgroup=ds,
-                    showlegend=False
-                ),
-                row=total_rows, col=1
-            )
-        fig.update_yaxes(
+        for j, ds in enumerate(selected_ds):
+            xv, yv = series[ds]
+            traces.append(dict(
+                type='scatter',
+                x=xv, y=yv,
+                mode='lines', name=ds,
+                line=dict(color=_BASE_COLORS[j % len(_BASE_COLORS)]),
+                legendgroup=ds,
+                showlegend=False
+            ))
+            rows.append(total_rows)
+        axis_layout[_axis_key("y", total_rows)] = dict(
             type='linear', tickformat=".2f",
-            automargin=True, row=total_rows, col=1
+            automargin=True
         )
 
     # show x-ticks on every row
     for i in range(1, total_rows + 1):
-        fig.update_xaxes(showticklabels=True, row=i, col=1)
+        axis_layout[_axis_key("x", i)] = dict(showticklabels=True)
 
     # annotations
-    annotations = []
-    for i, ds in enumerate(selected_ds, start=1):
-        yref = "y domain" if i == 1 else f"y{i} domain"
-        annotations.append(dict(
-            xref="paper", yref=yref,
-            x=-0.10, y=0.5, xanchor="right",
-            text=ds, showarrow=False,
-            textangle=-90,
-            font=dict(family="Arial", size=18, color="black")
-        ))
-    if has_combined:
-        yref = f"y{total_rows} domain"
-        annotations.append(dict(
-            xref="paper", yref=yref,
-            x=-0.10, y=0.5, xanchor="right",
-            text="Combined", showarrow=False,
-            textangle=-90,
-            font=dict(family="Arial", size=18, color="black")
-        ))
+    labels = list(selected_ds) + (["Combined"] if has_combined else [])
+    annotations = [_row_label(i, text) for i, text in enumerate(labels, start=1)]
 
-    fig.update_layout(
-        title=dict(text=f"{column} Across Datasets", x=0.5, font=dict(size=16)),
-        width=1000,
-        height=200 * total_rows,
-        margin=dict(l=200, r=20, t=50, b=40),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(family="Arial", size=12, color="#1a2a3a"),
-        annotations=annotations,
-        showlegend=True,
-        legend=dict(
-            bgcolor="rgba(255,255,255,0.8)",
-            bordercolor="#cccccc", borderwidth=1
-        )
-    )
-
-    safe = lambda s: s.replace(" ", "_").replace("/", "_")
-    fig._filename = f"{safe(column)}_across_{safe('_'.join(selected_ds))}.html"
-    return fig
+    # grid, axes, annotations and styling are assembled in one pass
+    return _assemble(traces, rows, axis_layout, _figure_style(f"{column} Across Datasets", total_rows, annotations),
+                     mult_sub_plot_filename(column, selected_ds))
 
-def wrap_html(inner: str) -> str:
-    """
-    Purpose:
-    - Wraps a raw HTML snippet in a scrollable, horizontally centered HTML shell.
-    - Useful for embedding Plotly figures or other interactive fragments.
-    Args:
-    - inner (str): HTML content to embed within the scroll container.
-    Returns:
-    - str: Complete HTML document string with styles for full-height scroll.
-    """
-    return f"""<!DOCTYPE html>
+# Page shell used by wrap_html(); built once at import, filled with str.format
+_HTML_SHELL = """<!DOCTYPE html>
 <html><head><meta charset="utf-8">
   <style>
     html, body {{
@@ -280,4 +507,87 @@ def wrap_html(inner: str) -> str:
   <div id="scroll-container">
     {inner}
   </div>
-</body></html>"""
\ No newline at end of file
+</body></html>"""
+
+def wrap_html(inner: str) -> str:
+    """
+    Purpose:
+    - Wraps a raw HTML snippet in a scrollable, horizontally centered HTML shell.
+    - Useful for embedding Plotly figures or other interactive fragments.
+    - Build `inner` with fig.to_html(full_html=False, include_plotlyjs="cdn") so the page loads
+      plotly.js from the CDN instead of inlining ~3 MB of library per figure.
+    Args:
+    - inner (str): HTML content to embed within the scroll container.
+    Returns:
+    - str: Complete HTML document string with styles for full-height scroll.
+    """
+    return _HTML_SHELL.format(inner=inner)
+
+PLOTLY_CDN_URL = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"   # same build plotly's include_plotlyjs="cdn" points at
+
+# Page pieces for write_figure_html(); the figure JSON is streamed between _PLOT_OPEN and _PLOT_CLOSE
+_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+  <style>html, body {height: 100%;}</style>
+</head><body>
+"""
+_TAIL = """
+</body></html>"""
+_SCROLL_HEAD, _SCROLL_TAIL = _HTML_SHELL.format(inner="\0").split("\0")
+_PLOT_OPEN = f"""<div style="height:{{height}}; width:{{width}};">
+<script charset="utf-8" src="{PLOTLY_CDN_URL}"></script>
+<div id="plot" style="height:100%; width:100%;"></div>
+<script>var fig = """
+_PLOT_CLOSE = """;
+Plotly.newPlot("plot", fig.data, fig.layout, {responsive: true});
+</script>
+</div>"""
+
+def _figure_page(fig, scroll: bool, layout: dict | None):
+    """
+    Purpose:
+    - Yields the pieces of a standalone page for `fig`: the prebuilt head, plot container and tail around
+      the figure JSON, so callers can stream them to disk or join them without copying the JSON twice.
+    """
+    fig_dict = fig.to_dict() if isinstance(fig, go.Figure) else fig   # to_dict() is what fig.to_json() serializes anyway
+    if layout:
+        fig_dict = dict(fig_dict, layout=dict(fig_dict["layout"], **layout))
+    size = lambda v: "100%" if v is None else f"{v}px"
+    head, tail = (_SCROLL_HEAD, _SCROLL_TAIL) if scroll else (_HEAD, _TAIL)
+    yield head
+    yield _PLOT_OPEN.format(height=size(fig_dict["layout"].get("height")),
+                            width=size(fig_dict["layout"].get("width")))
+    yield pio.to_json(fig_dict, validate=False)
+    yield _PLOT_CLOSE
+    yield tail
+
+def figure_html(fig, scroll: bool = True) -> str:
+    """
+    Purpose:
+    - Returns `fig` as a complete HTML page (by default in wrap_html()'s scrollable shell), for the in-app web view.
+    - Same page write_figure_html() saves, built from the prebuilt constants instead of
+      fig.to_html(include_plotlyjs="cdn") + wrap_html(), which re-hash plotly.js and copy the page per plot.
+    Args:
+    - fig (go.Figure | FigureDict): Figure to render.
+    - scroll (bool): Place the plot in the scrollable, centered shell.
+    Returns:
+    - str: Complete HTML document string.
+    """
+    return "".join(_figure_page(fig, scroll, None))
+
+def write_figure_html(fig, path: str, scroll: bool = False, layout: dict | None = None):
+    """
+    Purpose:
+    - Writes `fig` as a standalone HTML page that loads plotly.js from the CDN.
+    - The page is assembled from prebuilt constants around fig.to_json() and streamed through a
+      1 MiB buffer, instead of building the whole document with fig.write_html()/to_html()
+      (which also re-hashes the bundled plotly.js for its integrity attribute on every call).
+    Args:
+    - fig (go.Figure | FigureDict): Figure to write; FigureDicts are serialized without any further validation.
+    - path (str): Output file path.
+    - scroll (bool): Place the plot in wrap_html()'s scrollable, centered shell.
+    - layout (dict, optional): Top-level layout keys to override in the written page only; `fig` itself
+      is left untouched, so cached figures can be saved with export sizing without affecting other users.
+    """
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(_figure_page(fig, scroll, layout))
@@ -0,0 +1,62 @@
+#graph/helpers_numba.py
+
+"""
+Purpose:
+- Provides an optional Numba-compiled M4 downsampling kernel for the plotting hot path.
+- Used by graph/helpers.py when Numba is installed; _m4_index falls back to vectorized NumPy otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:     #Numba is optional; callers check NUMBA_AVAILABLE
+    njit = prange = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def m4_picks(y: np.ndarray, size: int, n_buckets: int) -> np.ndarray:
+    """
+    Purpose:
+    - Finds the first, last, min and max position of every `size`-point bucket in one pass over `y`,
+      without the padded copy and NaN-masked temporaries the NumPy version needs.
+    - NaN values are never picked as min/max; buckets with no valid value fall back to their first point,
+      and ties keep the earliest position (as argmin/argmax do).
+    Args:
+    - y (np.ndarray): Contiguous float32/float64 y values.
+    - size (int): Points per bucket; the last bucket may be short.
+    - n_buckets (int): Number of buckets covering `y`.
+    Returns:
+    - np.ndarray: Unsorted int64 positions, 4 per bucket (duplicates possible).
+    """
+    return _m4_picks(y, size, n_buckets)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _m4_picks(y, size, n_buckets):
+        n = len(y)
+        out = np.empty(4 * n_buckets, dtype=np.int64)
+        for b in prange(n_buckets):
+            first = b * size
+            last = min(first + size, n) - 1
+            lo = first
+            hi = first
+            lo_v = np.inf
+            hi_v = -np.inf
+            for i in range(first, last + 1):
+                v = y[i]
+                if v < lo_v:        #NaN compares False, so it is never picked
+                    lo_v = v
+                    lo = i
+                if v > hi_v:
+                    hi_v = v
+                    hi = i
+            out[4 * b] = first
+            out[4 * b + 1] = lo
+            out[4 * b + 2] = hi
+            out[4 * b + 3] = last
+        return out
+else:
+    _m4_picks = None
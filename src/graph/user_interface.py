@@ -7,20 +7,100 @@ Purpose:
 """
 
 import os
+import atexit
+import threading
+import tempfile
+import contextlib
 import pandas as pd
 from PyQt6.QtWidgets import (
     QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QSizePolicy, QProgressBar, QFileDialog, QMessageBox,
     QWidget, QComboBox, QListWidget, QListWidgetItem, QTabWidget,
-    QDialog, QDialogButtonBox, QCheckBox
+    QDialog, QDialogButtonBox, QCheckBox, QListView
 )
 from PyQt6.QtGui import QFontMetrics
-from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QAbstractListModel, QModelIndex, QUrl, QThreadPool
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from numpy.ma.core import nonzero
-from graph.workers import (GraphLoadWorker, PlotWorker,
+from graph.helpers import clear_plot_cache, write_figure_html
+from graph.workers import (GraphLoadWorker, PlotRunnable,
                            SaveMultipleWorker, SaveMultiColumnWorker)
 
+GRAPH_CACHE_SIZE = 4  #loaded graph files kept in memory for instant reloads
+_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable  #flags for rows in the checkable lists
+
+def _remove_file(path: str):
+    """
+    Purpose:
+    - Deletes a scratch file, ignoring it if it is already gone.
+    """
+    with contextlib.suppress(OSError):
+        os.remove(path)
+
+class ElidedLabel(QLabel):
+    """
+    Purpose:
+    - Label that keeps its full text and shows it middle-elided to the current width
+    - Re-elides only when resized, so callers just hand it the full text once
+    """
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(parent)
+        self.setMinimumWidth(1) #the elided text must not hold the label open at its full width
+        self.setFullText(text)
+
+    def setFullText(self, text: str):
+        self._full = text
+        self._elide()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._elide()
+
+    def _elide(self):
+        self.setText(QFontMetrics(self.font()).elidedText(self._full, Qt.TextElideMode.ElideMiddle, self.width() - 20))
+
+class CheckListModel(QAbstractListModel):
+    """
+    Purpose:
+    - Lightweight checkable list model for the selection dialogs
+    - Check states live in a bytearray, so 'Select All' is one slice write and one dataChanged signal
+    """
+    def __init__(self, names: list[str], checked: bool = True, parent=None):
+        super().__init__(parent)
+        self._names = list(names)
+        self._checked = bytearray([1 if checked else 0]) * len(self._names)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[index.row()]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self._checked[index.row()] else Qt.CheckState.Unchecked
+        return None
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsUserCheckable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        self._checked[index.row()] = 1 if Qt.CheckState(value) == Qt.CheckState.Checked else 0
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def set_all(self, checked: bool):
+        if not self._names:
+            return
+        self._checked[:] = bytes([1 if checked else 0]) * len(self._checked)
+        self.dataChanged.emit(self.index(0), self.index(len(self._names) - 1),
+                              [Qt.ItemDataRole.CheckStateRole])
+
+    def checked_names(self) -> list[str]:
+        return [name for name, flag in zip(self._names, self._checked) if flag]
+
 class DatasetSelectDialog(QDialog):
     """
     Purpose:
@@ -38,12 +118,10 @@ class DatasetSelectDialog(QDialog):
         self.select_all.clicked.connect(self._toggle_all)
         layout.addWidget(self.select_all)
 
-        self.checkboxes = []
-        for name in dataset_list:
-            cb = QCheckBox(name)
-            cb.setChecked(True)
-            self.checkboxes.append(cb)
-            layout.addWidget(cb)
+        self.model = CheckListModel(dataset_list, checked=True, parent=self)
+        view = QListView(self)
+        view.setModel(self.model)
+        layout.addWidget(view)
 
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok |
@@ -54,12 +132,10 @@ class DatasetSelectDialog(QDialog):
         layout.addWidget(buttons)
 
     def _toggle_all(self):
-        checked = self.select_all.isChecked()
-        for cb in self.checkboxes:
-            cb.setChecked(checked)
+        self.model.set_all(self.select_all.isChecked())
 
     def get_selection(self) -> list[str]:
-        return [cb.text() for cb in self.checkboxes if cb.isChecked()]
+        return self.model.checked_names()
 
 class ColumnSelectDialog(QDialog):
     """
@@ -78,12 +154,10 @@ class ColumnSelectDialog(QDialog):
         self.select_all.clicked.connect(self._toggle_all)
         layout.addWidget(self.select_all)
 
-        self.checkboxes = []
-        for name in column_list:
-            cb = QCheckBox(name)
-            cb.setChecked(True)
-            self.checkboxes.append(cb)
-            layout.addWidget(cb)
+        self.model = CheckListModel(column_list, checked=True, parent=self)
+        view = QListView(self)
+        view.setModel(self.model)
+        layout.addWidget(view)
 
         buttons = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok |
@@ -94,25 +168,23 @@ class ColumnSelectDialog(QDialog):
         layout.addWidget(buttons)
 
     def _toggle_all(self):
-        checked = self.select_all.isChecked()
-        for cb in self.checkboxes:
-            cb.setChecked(checked)
+        self.model.set_all(self.select_all.isChecked())
 
     def get_selection(self) -> list[str]:
-        return [cb.text() for cb in self.checkboxes if cb.isChecked()]
+        return self.model.checked_names()
 
 class GraphSettingsPanel(QGroupBox):
     """
     Purpose:
      - Provide UI for graph setup via single-dataset and multi-dataset tabs
      - Collect user selections for datasets and columns
-     - Trigger background PlotWorker for selected graphing mode
+     - Trigger background PlotRunnable for selected graphing mode
      - Emit plotReady with figure, HTML content, mode, and metadata
      - Optionally emit filedataReady with tabular data for export
     """
 
     plotReady = pyqtSignal(object, str, str, object)
-    filedataReady = pyqtSignal(list, list, object, str)
+    filedataReady = pyqtSignal(list, list, object, str, object)
 
     def __init__(self, parent=None):
         """
@@ -125,13 +197,21 @@ class GraphSettingsPanel(QGroupBox):
         """
         super().__init__("3) Graph Settings", parent)
         self.graphing_dataframe = None
+        self._dataset_groups = {}         # dataset name -> row positions in graphing_dataframe
         self.loader = None
-        self._plot_worker = None
         self.current_fig = None
         self.last_plot_type = None
         self._last_cols = None
         self._last_datasets = None
         self.graph_file = None
+        self._last_path_shown = None      # path currently shown in both file labels
+        self._checked_cols = set()        # kept in sync with columns_list check states via itemChanged
+        self._checked_datasets = set()    # kept in sync with dataset2_list check states via itemChanged
+        self._column_order = {}           # name -> row, so submitted selections keep list order
+        self._dataset_order = {}
+        self._df_cache = {}               # (path, mtime, size) -> loaded DataFrame, most recent last
+        self._plot_generation = 0         # bumped per submitted plot; results from older jobs are dropped
+        self._plot_cancel = None          # cancel flag of the newest plot job
         self._build_ui()
 
     def _build_ui(self):
@@ -151,18 +231,19 @@ class GraphSettingsPanel(QGroupBox):
 
         dl.addWidget(QLabel("Select file for graph data:", tab1))
         h1 = QHBoxLayout()
-        self.graph_file_lbl = QLabel("No file selected", tab1)
+        self.graph_file_lbl = ElidedLabel("No file selected", tab1)
         self.graph_file_lbl.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
         )
         btn_browse_1 = QPushButton("Browse…", tab1)
         btn_browse_1.clicked.connect(self.graph_file_browse)
+        self._btn_browse_1 = btn_browse_1
         h1.addWidget(self.graph_file_lbl)
         h1.addWidget(btn_browse_1)
         dl.addLayout(h1)
 
         self.graph_progress = QProgressBar(tab1)
-        self.graph_progress.setRange(0, 0)
+        self.graph_progress.setRange(0, 100)
         self.graph_progress.setVisible(False)
         dl.addWidget(self.graph_progress)
 
@@ -174,6 +255,7 @@ class GraphSettingsPanel(QGroupBox):
         dl.addWidget(QLabel("Pick one or more columns to graph:", tab1))
         self.columns_list = QListWidget(tab1)
         self.columns_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        self.columns_list.itemChanged.connect(self._on_column_item_changed)
         dl.addWidget(self.columns_list)
 
         self.plot_btn_1 = QPushButton("Submit", tab1)
@@ -182,7 +264,7 @@ class GraphSettingsPanel(QGroupBox):
         dl.addWidget(self.plot_btn_1)
 
         self.plot1_progress = QProgressBar(tab1)
-        self.plot1_progress.setRange(0, 0)
+        self.plot1_progress.setRange(0, 100)
         self.plot1_progress.setVisible(False)
         dl.addWidget(self.plot1_progress)
 
@@ -194,18 +276,19 @@ class GraphSettingsPanel(QGroupBox):
 
         tl.addWidget(QLabel("Select file for graph data:", tab2))
         h2 = QHBoxLayout()
-        self.graph_file2_lbl = QLabel("No file selected", tab2)
+        self.graph_file2_lbl = ElidedLabel("No file selected", tab2)
         self.graph_file2_lbl.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
         )
         btn_browse_2 = QPushButton("Browse…", tab2)
         btn_browse_2.clicked.connect(self.graph_file_browse)
+        self._btn_browse_2 = btn_browse_2
         h2.addWidget(self.graph_file2_lbl)
         h2.addWidget(btn_browse_2)
         tl.addLayout(h2)
 
         self.graph2_progress = QProgressBar(tab2)
-        self.graph2_progress.setRange(0, 0)
+        self.graph2_progress.setRange(0, 100)
         self.graph2_progress.setVisible(False)
         tl.addWidget(self.graph2_progress)
 
@@ -217,6 +300,7 @@ class GraphSettingsPanel(QGroupBox):
         tl.addWidget(QLabel("Pick one or more datasets to graph:", tab2))
         self.dataset2_list = QListWidget(tab2)
         self.dataset2_list.setSelectionMode(QListWidget.SelectionMode.NoSelection)
+        self.dataset2_list.itemChanged.connect(self._on_dataset_item_changed)
         tl.addWidget(self.dataset2_list)
 
         self.plot_btn_2 = QPushButton("Submit", tab2)
@@ -225,7 +309,7 @@ class GraphSettingsPanel(QGroupBox):
         tl.addWidget(self.plot_btn_2)
 
         self.plot2_progress = QProgressBar(tab2)
-        self.plot2_progress.setRange(0, 0)
+        self.plot2_progress.setRange(0, 100)
         self.plot2_progress.setVisible(False)
         tl.addWidget(self.plot2_progress)
 
@@ -235,136 +319,165 @@ class GraphSettingsPanel(QGroupBox):
     def set_graph_file(self, path: str):
         """
         Purpose:
-        - Sets the graph file path manually (via signal or external method call).
-        - Updates both file labels, loads the file, and populates plot controls.
-        - Emits filedataReady signal once data and metadata are available.
+        - Sets the graph file path manually (via signal or external method call) or after browsing.
+        - Updates both file labels, shows progress, and starts GraphLoadWorker so the read stays off the UI thread.
+        - On success or error, flow continues to corresponding slot.
         Args:
         - path (str): Path to the file to use for plotting.
         """
         self.graph_file = path
-        export_dir = os.path.dirname(self.graph_file)
 
-        # Update labels with elided path
-        fm = QFontMetrics(self.graph_file_lbl.font())
-        w = self.graph_file_lbl.width() - 20
-        elided = fm.elidedText(path, Qt.TextElideMode.ElideMiddle, w)
-        self.graph_file_lbl.setText(elided)
-        self.graph_file2_lbl.setText(elided)
+        # Labels elide the path themselves, and again whenever they are resized
+        if path != self._last_path_shown:
+            self.graph_file_lbl.setFullText(path)
+            self.graph_file2_lbl.setFullText(path)
+            self._last_path_shown = path
 
-        # Load the file
+        # Reloading an unchanged file reuses the DataFrame parsed last time
         try:
-            df = pd.read_csv(path)
-        except Exception as e:
-            QMessageBox.critical(self, "Load Error", str(e))
+            key = (path, os.path.getmtime(path), os.path.getsize(path))
+        except OSError:
+            key = None  #let the worker report the error
+        if key in self._df_cache:
+            self._populate_from_df(self._df_cache[key])
             return
 
-        # Populate UI widgets
-        self.graphing_dataframe = df
-        datasets = sorted(df["Dataset"].astype(str).unique())
-        columns = [c for c in df.columns if c not in ("Time", "Dataset")]
-
-        self.dataset_combo.clear()
-        self.dataset_combo.addItems(datasets)
-        self.dataset_combo.setEnabled(True)
-
-        self.columns_list.clear()
-        for col in columns:
-            item = QListWidgetItem(col)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            self.columns_list.addItem(item)
-
-        self.column2_combo.clear()
-        self.column2_combo.addItems(columns)
-        self.column2_combo.setEnabled(True)
-
-        self.dataset2_list.clear()
-        for ds in datasets:
-            item = QListWidgetItem(ds)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            self.dataset2_list.addItem(item)
+        self.graph_progress.setValue(0)
+        self.graph2_progress.setValue(0)
+        self.graph_progress.setVisible(True)
+        self.graph2_progress.setVisible(True)
+        self._btn_browse_1.setVisible(False)
+        self._btn_browse_2.setVisible(False)
 
-        # Emit signal
-        self.filedataReady.emit(datasets, columns, df, export_dir)
-        self.plot_btn_1.setEnabled(True) #enable buttons
-        self.plot_btn_2.setEnabled(True)
+        self.loader = GraphLoadWorker(path)
+        self.loader.cache_key = key #read back in graph_file_loaded, so overlapping loads can't swap entries
+        self.loader.progress.connect(self.graph_progress.setValue)
+        self.loader.progress.connect(self.graph2_progress.setValue)
+        self.loader.finished.connect(self.graph_file_loaded)
+        self.loader.errored.connect(self.graph_file_load_error)
+        self.loader.start()
 
     @pyqtSlot()
     def graph_file_browse(self):
         """
         Purpose:
-        - Opens a file dialog for selecting the graph data file.
-        - Updates file labels, shows progress, and starts GraphLoadWorker.
-        - On success or error, flow continues to corresponding slot.
+        - Opens a file dialog for selecting the graph data file and loads it via set_graph_file().
         """
         path, _ = QFileDialog.getOpenFileName(
-            self, "Select File", "", "Data Files (*.csv *.xlsx *.xls);;All Files (*)"
+            self, "Select File", "", "Data Files (*.csv *.parquet *.xlsx *.xls);;All Files (*)"
         )
         if not path:
             return
-        self.graph_file = path
-
-        fm = QFontMetrics(self.graph_file_lbl.font())
-        w = self.graph_file_lbl.width() - 20
-        elided = fm.elidedText(path, Qt.TextElideMode.ElideMiddle, w)
-        self.graph_file_lbl.setText(elided)
-        self.graph_file2_lbl.setText(elided)
-
-        self.graph_progress.setVisible(True)
-        self.graph2_progress.setVisible(True)
-        self.graph_file_lbl.parentWidget().findChild(QPushButton).setVisible(False)
-
-        self.loader = GraphLoadWorker(path)
-        self.loader.finished.connect(self.graph_file_loaded)
-        self.loader.errored.connect(self.graph_file_load_error)
-        self.loader.start()
+        self.set_graph_file(path)
 
     @pyqtSlot(object)
     def graph_file_loaded(self, df: pd.DataFrame):
         """
         Purpose:
         - Called when GraphLoadWorker finishes successfully.
-        - Populates dataset and column controls in both tabs.
-        - Emits filedataReady signal to notify downstream graph display logic.
+        - Restores the file controls and hands the DataFrame to _populate_from_df().
         Args:
         - df (pd.DataFrame): Loaded DataFrame from graph file.
         """
         self.graph_progress.setVisible(False)
         self.graph2_progress.setVisible(False)
-        self.graph_file_lbl.parentWidget().findChild(QPushButton).setVisible(True)
+        self._btn_browse_1.setVisible(True)
+        self._btn_browse_2.setVisible(True)
+
+        key = getattr(self.sender(), "cache_key", None)
+        if key is not None:
+            self._df_cache[key] = df
+            clear_plot_cache()     #figures of the previous (or evicted) frame would only pin it in memory
+            while len(self._df_cache) > GRAPH_CACHE_SIZE:  #drop the oldest entry
+                del self._df_cache[next(iter(self._df_cache))]
+        self._populate_from_df(df)
 
+    def _populate_from_df(self, df: pd.DataFrame):
+        """
+        Purpose:
+        - Single write point for a newly loaded DataFrame.
+        - Populates dataset and column controls in both tabs.
+        - Builds the dataset -> row positions map shared by the plot and save workers.
+        - Emits filedataReady signal to notify downstream graph display logic.
+        Args:
+        - df (pd.DataFrame): Loaded DataFrame from graph file.
+        """
         self.graphing_dataframe = df
-        datasets = sorted(df["Dataset"].astype(str).unique())
-        columns = [c for c in df.columns if c not in ("Time", "Dataset")]
+        datasets = df.attrs["datasets"]   #listed by GraphLoadWorker
+        #One pass over Dataset; workers slice with iloc instead of re-comparing the column per plot
+        self._dataset_groups = {
+            str(ds): rows for ds, rows in df.groupby("Dataset", observed=True, sort=False).indices.items()
+        }
+        columns = df.attrs["columns"]
 
         self.dataset_combo.clear()
         self.dataset_combo.addItems(datasets)
         self.dataset_combo.setEnabled(True)
 
-        self.columns_list.clear()
-        for col in columns:
-            item = QListWidgetItem(col)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            self.columns_list.addItem(item)
+        self._checked_cols.clear()
+        self._checked_datasets.clear()
+        self._column_order = {name: i for i, name in enumerate(columns)}
+        self._dataset_order = {name: i for i, name in enumerate(datasets)}
+        self._populate_check_list(self.columns_list, columns)
 
         self.column2_combo.clear()
         self.column2_combo.addItems(columns)
         self.column2_combo.setEnabled(True)
 
-        self.dataset2_list.clear()
-        for ds in datasets:
-            item = QListWidgetItem(ds)
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            self.dataset2_list.addItem(item)
+        self._populate_check_list(self.dataset2_list, datasets)
 
         export_dir = os.path.dirname(self.graph_file)
-        self.filedataReady.emit(datasets, columns, df, export_dir)
+        self.filedataReady.emit(datasets, columns, df, export_dir, self._dataset_groups)
         self.plot_btn_1.setEnabled(True) #enable buttons
         self.plot_btn_2.setEnabled(True)
 
+    @staticmethod
+    def _populate_check_list(listwidget: QListWidget, names: list[str]):
+        """
+        Purpose:
+        - Refills a checkable list with unchecked rows cloned from one prototype item.
+        - Repaint and itemChanged are held until the list is full.
+        Args:
+        - listwidget (QListWidget): List to refill.
+        - names (list[str]): Row labels, in display order.
+        """
+        proto = QListWidgetItem()
+        proto.setFlags(_FLAGS)
+        proto.setCheckState(Qt.CheckState.Unchecked)
+
+        listwidget.setUpdatesEnabled(False)
+        listwidget.blockSignals(True)
+        listwidget.clear()
+        for name in names:
+            item = proto.clone()
+            item.setText(name)
+            listwidget.addItem(item)
+        listwidget.blockSignals(False)
+        listwidget.setUpdatesEnabled(True)
+        listwidget.viewport().update()
+
+    @pyqtSlot(QListWidgetItem)
+    def _on_column_item_changed(self, item: QListWidgetItem):
+        """
+        Purpose:
+        - Mirrors a column check-state change into self._checked_cols.
+        """
+        if item.checkState() == Qt.CheckState.Checked:
+            self._checked_cols.add(item.text())
+        else:
+            self._checked_cols.discard(item.text())
+
+    @pyqtSlot(QListWidgetItem)
+    def _on_dataset_item_changed(self, item: QListWidgetItem):
+        """
+        Purpose:
+        - Mirrors a dataset check-state change into self._checked_datasets.
+        """
+        if item.checkState() == Qt.CheckState.Checked:
+            self._checked_datasets.add(item.text())
+        else:
+            self._checked_datasets.discard(item.text())
+
     @pyqtSlot(str)
     def graph_file_load_error(self, msg: str):
         """
@@ -376,7 +489,8 @@ class GraphSettingsPanel(QGroupBox):
         """
         self.graph_progress.setVisible(False)
         self.graph2_progress.setVisible(False)
-        self.graph_file_lbl.parentWidget().findChild(QPushButton).setVisible(True)
+        self._btn_browse_1.setVisible(True)
+        self._btn_browse_2.setVisible(True)
         QMessageBox.critical(self, "Load Error", msg)
 
     @pyqtSlot()
@@ -384,72 +498,95 @@ class GraphSettingsPanel(QGroupBox):
         """
         Purpose:
         - Collects the selected dataset and column(s) from the single-dataset tab.
-        - Validates input and spawns a background PlotWorker with mode 'single'.
+        - Validates input and queues a PlotRunnable with mode 'single'.
         - Disables UI controls and shows progress until plotting is complete.
         """
         ds = self.dataset_combo.currentText()
 
-        cols = [
-            self.columns_list.item(i).text()
-            for i in range(self.columns_list.count())
-            if self.columns_list.item(i).checkState() == Qt.CheckState.Checked
-        ]
+        cols = sorted(self._checked_cols, key=self._column_order.get)
 
         if not cols:
             QMessageBox.warning(self, "No Selection", "Pick at least one series.")
             return
         self._last_cols = cols
 
+        gen, cancel = self._next_plot_job()
+        self.plot1_progress.setValue(0)
         self.plot1_progress.setVisible(True)
         self.plot_btn_1.setVisible(False)
 
-        worker = PlotWorker("single", ds, cols, self.graphing_dataframe)
-        worker.finished.connect(self.on_plot_sing_done)
-        worker.errored.connect(self.on_plot_error)
-        worker.start()
-        self._plot_worker = worker
+        runner = PlotRunnable("single", ds, cols, self.graphing_dataframe, self._dataset_groups, generation=gen, cancel=cancel)
+        runner.signals.progress.connect(self.plot1_progress.setValue)
+        runner.signals.finished.connect(self.on_plot_sing_done)
+        runner.signals.errored.connect(self.on_plot_error)
+        QThreadPool.globalInstance().start(runner)
 
     @pyqtSlot()
     def plot_mult_sub(self):
         """
         Purpose:
         - Collects the selected column and dataset(s) from the multi-dataset tab.
-        - Validates input and spawns a background PlotWorker with mode 'multi'.
+        - Validates input and queues a PlotRunnable with mode 'multi'.
         - Disables UI controls and shows progress until plotting is complete.
         """
         col = self.column2_combo.currentText()
 
-        datasets = [
-            self.dataset2_list.item(i).text()
-            for i in range(self.dataset2_list.count())
-            if self.dataset2_list.item(i).checkState() == Qt.CheckState.Checked
-        ]
+        datasets = sorted(self._checked_datasets, key=self._dataset_order.get)
 
         if not datasets:
             QMessageBox.warning(self, "No Selection", "Pick at least one dataset.")
             return
         self._last_datasets = datasets
 
+        gen, cancel = self._next_plot_job()
+        self.plot2_progress.setValue(0)
         self.plot2_progress.setVisible(True)
         self.plot_btn_2.setVisible(False)
 
-        worker = PlotWorker("multi", col, datasets, self.graphing_dataframe)
-        worker.finished.connect(self.on_plot_mult_done)
-        worker.errored.connect(self.on_plot_error)
-        worker.start()
-        self._plot_worker = worker
+        runner = PlotRunnable("multi", col, datasets, self.graphing_dataframe, self._dataset_groups, generation=gen, cancel=cancel)
+        runner.signals.progress.connect(self.plot2_progress.setValue)
+        runner.signals.finished.connect(self.on_plot_mult_done)
+        runner.signals.errored.connect(self.on_plot_error)
+        QThreadPool.globalInstance().start(runner)
+
+    def _next_plot_job(self) -> tuple[int, threading.Event]:
+        """
+        Purpose:
+        - Cancels the running plot job (if any) and resets both tabs' plot controls.
+        - Returns the generation number and cancel flag for the job about to start.
+        """
+        if self._plot_cancel is not None:
+            self._plot_cancel.set()
+        self._plot_generation += 1
+        self._plot_cancel = threading.Event()
+        self._reset_plot_controls()
+        return self._plot_generation, self._plot_cancel
+
+    def _reset_plot_controls(self):
+        """
+        Purpose:
+        - Hides both plot progress bars and shows both Submit buttons.
+        """
+        self.plot1_progress.setVisible(False)
+        self.plot_btn_1.setVisible(True)
+        self.plot2_progress.setVisible(False)
+        self.plot_btn_2.setVisible(True)
 
-    @pyqtSlot(object, str)
-    def on_plot_sing_done(self, fig, html):
+    @pyqtSlot(object, str, int)
+    def on_plot_sing_done(self, fig, html, gen):
         """
         Purpose:
-        - Receives figure and HTML output from PlotWorker (single-dataset mode).
+        - Receives figure and HTML output from PlotRunnable (single-dataset mode).
+        - Drops results from superseded jobs.
         - Stores result internally and emits plotReady signal for display.
         - Restores UI controls after successful plot.
         Args:
         - fig: Generated Plotly figure object.
         - html: HTML string to render inside the web view.
+        - gen: Generation number the job was started with.
         """
+        if gen != self._plot_generation:
+            return
         self.current_fig = fig
         self.last_plot_type = "single"
         cols = self._last_cols
@@ -457,17 +594,21 @@ class GraphSettingsPanel(QGroupBox):
         self.plot1_progress.setVisible(False)
         self.plot_btn_1.setVisible(True)
 
-    @pyqtSlot(object, str)
-    def on_plot_mult_done(self, fig, html):
+    @pyqtSlot(object, str, int)
+    def on_plot_mult_done(self, fig, html, gen):
         """
         Purpose:
-        - Receives figure and HTML output from PlotWorker (multi-dataset mode).
+        - Receives figure and HTML output from PlotRunnable (multi-dataset mode).
+        - Drops results from superseded jobs.
         - Stores result internally and emits plotReady signal for display.
         - Restores UI controls after successful plot.
         Args:
         - fig: Generated Plotly figure object.
         - html: HTML string to render inside the web view.
+        - gen: Generation number the job was started with.
         """
+        if gen != self._plot_generation:
+            return
         self.current_fig = fig
         self.last_plot_type = "multi"
         datasets = self._last_datasets  # Ensure this is set in plot_mult_sub
@@ -476,21 +617,21 @@ class GraphSettingsPanel(QGroupBox):
         self.plot2_progress.setVisible(False)
         self.plot_btn_2.setVisible(True)
 
-    @pyqtSlot(str)
-    def on_plot_error(self, msg: str):
+    @pyqtSlot(str, int)
+    def on_plot_error(self, msg: str, gen: int):
         """
         Purpose:
-        - Handles any error emitted by a PlotWorker.
+        - Handles any error emitted by the current PlotRunnable (superseded jobs are ignored).
         - Re-enables both plot buttons and hides progress indicators.
         - Displays an error dialog with the provided message.
         Args:
         - msg (str): Error message string from worker.
+        - gen (int): Generation number the job was started with.
         """
+        if gen != self._plot_generation:
+            return
         QMessageBox.critical(self, "Plot Error", msg)
-        self.plot1_progress.setVisible(False)
-        self.plot_btn_1.setVisible(True)
-        self.plot2_progress.setVisible(False)
-        self.plot_btn_2.setVisible(True)
+        self._reset_plot_controls()
 
 class GraphDisplayPanel(QGroupBox):
     """
@@ -522,9 +663,17 @@ class GraphDisplayPanel(QGroupBox):
         self.cols = None
         self.datasets = None
         self.graphing_dataframe = None
+        self.dataset_groups = {}
         self._dataset_names = None
         self._column_names = None
         self.export_dir = None
+
+        #Plots are rendered from a scratch file: QtWebEngine then loads plotly.js from the CDN through its
+        #HTTP cache instead of re-fetching it for every setHtml() blob (which is also capped at 2 MB)
+        fd, self._plot_tmp = tempfile.mkstemp(prefix="pymerge_plot_", suffix=".html")
+        os.close(fd)
+        atexit.register(_remove_file, self._plot_tmp)
+
         self._build_ui()
 
     def _build_ui(self):
@@ -544,6 +693,9 @@ class GraphDisplayPanel(QGroupBox):
         layout.addWidget(self.web_view)
 
         btn_layout = QHBoxLayout()
+        self.save_progress = QProgressBar(self)
+        self.save_progress.setVisible(False)
+        btn_layout.addWidget(self.save_progress)
         btn_layout.addStretch()
 
         self.save_sing_btn = QPushButton("Save Example Graph", self)
@@ -572,7 +724,12 @@ class GraphDisplayPanel(QGroupBox):
         """
         self.current_fig = fig
         self.last_plot_type = mode
-        self.web_view.setHtml(html)
+        try:
+            with open(self._plot_tmp, "w", encoding="utf-8") as f:
+                f.write(html)
+            self.web_view.load(QUrl.fromLocalFile(self._plot_tmp))
+        except OSError:
+            self.web_view.setHtml(html) #scratch file unavailable; render the HTML directly
         if mode == "single":
             self.cols = graph_list
             self.datasets = None
@@ -580,8 +737,9 @@ class GraphDisplayPanel(QGroupBox):
             self.cols = None
             self.datasets = graph_list
 
-    @pyqtSlot(list, list, object, str)
-    def receive_file_data(self, dataset_list: list[str], column_list: list[str], df: pd.DataFrame, export_dir: str):
+    @pyqtSlot(list, list, object, str, object)
+    def receive_file_data(self, dataset_list: list[str], column_list: list[str], df: pd.DataFrame, export_dir: str,
+                          dataset_groups: dict):
         """
         Purpose:
         - Stores the dataset names, column names, and full DataFrame for graphing and export.
@@ -590,10 +748,13 @@ class GraphDisplayPanel(QGroupBox):
         - dataset_list: List of dataset identifiers found in file.
         - column_list: List of column headers available for graphing.
         - df: Full DataFrame loaded from the file.
+        - export_dir: Default folder for saved graphs.
+        - dataset_groups: Dataset name -> row positions in df.
         """
         self._dataset_names = dataset_list
         self._column_names = column_list
         self.graphing_dataframe = df
+        self.dataset_groups = dataset_groups
         self.export_dir = export_dir
 
     @pyqtSlot()
@@ -614,7 +775,7 @@ class GraphDisplayPanel(QGroupBox):
             path += ".html"
 
         try:
-            fig.write_html(path)
+            write_figure_html(fig, path)   # same as the batch save workers
             # Normalize for display purposes
             display_path = path.replace("\\", "/")
             QMessageBox.information(self, "Saved", f"Saved to:\n{display_path}")
@@ -646,11 +807,10 @@ class GraphDisplayPanel(QGroupBox):
                 datasets=selection,
                 y_axes=cols,
                 df=self.graphing_dataframe,
-                out_dir=out_dir
+                out_dir=out_dir,
+                groups=self.dataset_groups
             )
-            self._save_worker.finished.connect(self.on_save_mult_done)
-            self._save_worker.errored.connect(self.on_save_error)
-            self._save_worker.start()
+            self._start_save_worker(len(selection))
 
         if mode == "multi":
             out_dir = self.export_dir
@@ -666,11 +826,25 @@ class GraphDisplayPanel(QGroupBox):
                 datasets=datasets,
                 columns=selection,
                 df=self.graphing_dataframe,
-                out_dir=out_dir
+                out_dir=out_dir,
+                groups=self.dataset_groups
             )
-            self._save_worker.finished.connect(self.on_save_mult_done)
-            self._save_worker.errored.connect(self.on_save_error)
-            self._save_worker.start()
+            self._start_save_worker(len(selection))
+
+    def _start_save_worker(self, total: int):
+        """
+        Purpose:
+        - Connects and starts the save worker built by on_save_mult(), showing one progress step per file.
+        Args:
+        - total: Number of files the worker will write.
+        """
+        self.save_progress.setRange(0, total)
+        self.save_progress.setValue(0)
+        self.save_progress.setVisible(True)
+        self._save_worker.progress.connect(self.save_progress.setValue)
+        self._save_worker.finished.connect(self.on_save_mult_done)
+        self._save_worker.errored.connect(self.on_save_error)
+        self._save_worker.start()
 
     @pyqtSlot(list, str)
     def on_save_mult_done(self, saved_paths: list[str], out_dir: str):
@@ -682,6 +856,7 @@ class GraphDisplayPanel(QGroupBox):
         - saved_paths: List of saved file paths.
         - out_dir: Folder where files were written.
         """
+        self.save_progress.setVisible(False)
         QMessageBox.information(
             self, "Save Complete", f"Written {len(saved_paths)} files to:\n{out_dir}"
         )
@@ -694,6 +869,7 @@ class GraphDisplayPanel(QGroupBox):
         Args:
         - msg: Error message string from worker.
         """
+        self.save_progress.setVisible(False)
         QMessageBox.critical(self, "Save Error", msg)
 
     @pyqtSlot()
@@ -7,41 +7,134 @@ Purpose:
 - Uses PyQt6 threads to avoid blocking the GUI during heavy operations.
 """
 
-import os, time
+import os
+import threading
 import pandas as pd
-from PyQt6.QtCore import QThread, pyqtSignal
-from graph.helpers import sing_sub_plot, mult_sub_plot, wrap_html
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt6.QtCore import QThread, QObject, QRunnable, pyqtSignal
+from graph.helpers import (sing_sub_plot, mult_sub_plot, sing_sub_plot_filename, mult_sub_plot_filename,
+                           read_data_file, write_figure_html, figure_html)
+
+try:
+    import pyarrow as pa  #Optional; enables pyarrow's multi-threaded CSV reader
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+CHUNK_ROWS = 65_536         #rows per read_csv chunk when pyarrow is unavailable
+MAX_SAVE_WORKERS = 8        #upper bound on batch-save threads
+
+
+def _parquet_copy(path: str) -> str | None:
+    """
+    Purpose:
+    - Returns the Parquet file the binning step writes next to its optional CSV copy (same stem),
+      if pyarrow can read it and it is at least as new as `path`; otherwise None.
+    """
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    if not PYARROW_AVAILABLE or parquet_path == path or not os.path.exists(parquet_path):
+        return None
+    return parquet_path if os.path.getmtime(parquet_path) >= os.path.getmtime(path) else None
 
 class GraphLoadWorker(QThread):
     """
     Purpose:
-    - Loads an Excel spreadsheet from a given path on a separate thread.
+    - Loads a CSV or Parquet data file from a given path on a separate thread.
     - Emits the resulting DataFrame or an error message to the GUI.
+    - The sorted dataset labels and plottable columns are stored in df.attrs["datasets"] / df.attrs["columns"].
+    - CSVs are read in one pass by pyarrow's multi-threaded reader when installed (progress jumps to 100 at the end);
+      otherwise in chunks with the C engine, reporting how much of the file has been consumed after each one. A CSV with an up-to-date Parquet twin from the
+      binning step is loaded from the Parquet file instead.
     Args:
-    - path (str): File path to the Excel document to load.
+    - path (str): File path to the CSV or Parquet file to load.
+    - usecols (list[str], optional): Columns to read, when the caller already knows them.
     Signals:
+    - progress (int): Percentage of the file read so far (0-100).
     - finished (pd.DataFrame): Emitted when the file is successfully loaded.
     - errored (str): Emitted with error message if file load fails.
     """
+    progress = pyqtSignal(int)
     finished = pyqtSignal(pd.DataFrame)
     errored  = pyqtSignal(str)
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, usecols: list[str] | None = None):
         super().__init__()
         self.path = path
+        self.usecols = usecols
 
     def run(self):
         try:
-            df = pd.read_csv(self.path, na_filter=False)
-            print(df.dtypes)
+            parquet_path = self.path if self.path.lower().endswith(".parquet") else _parquet_copy(self.path)
+            if parquet_path is not None:
+                df = read_data_file(parquet_path)
+            else:
+                df = self._read_csv()
+            self.progress.emit(100)
+            df["Dataset"] = df["Dataset"].astype("category") #labels are listed from the categories, and filtering compares codes
+            #Listed once here for the settings panel, which reads them on every (re)population
+            df.attrs["datasets"] = sorted(df["Dataset"].cat.categories.astype(str))
+            df.attrs["columns"] = [c for c in df.columns if c not in ("Time", "Dataset")]
             self.finished.emit(df)
         except Exception as e:
             self.errored.emit(str(e))
 
-class PlotWorker(QThread):
+    def _read_csv(self) -> pd.DataFrame:
+        """
+        Purpose:
+        - Reads the CSV with the same semantics as pd.read_csv(na_filter=False): blank cells stay "" rather
+          than becoming NaN, so a column with blanks reads as text, and Time/Dataset are always text.
+        - pyarrow reads the whole file in one call, so column types are inferred from all rows; its streaming
+          reader fixes them from the first block and fails on files whose later rows disagree.
+        - The C-engine fallback streams CHUNK_ROWS chunks, emitting progress as bytes consumed / file size.
+        Returns:
+        - pd.DataFrame: Loaded data.
+        """
+        if PYARROW_AVAILABLE:
+            convert = pa_csv.ConvertOptions(
+                column_types={"Time": pa.string(), "Dataset": pa.string()},
+                null_values=[], strings_can_be_null=False,     #na_filter=False
+                include_columns=self.usecols
+            )
+            return pa_csv.read_csv(self.path, convert_options=convert).to_pandas()
+
+        total = max(os.path.getsize(self.path), 1)
+        with open(self.path, "rb") as f:
+            parts = []
+            for chunk in pd.read_csv(f, na_filter=False, usecols=self.usecols, chunksize=CHUNK_ROWS):
+                parts.append(chunk)
+                self.progress.emit(int(100 * f.tell() / total))
+            return pd.concat(parts, ignore_index=True)
+
+def _dataset_rows(df: pd.DataFrame, groups: dict, ds: str) -> pd.DataFrame:
+    """
+    Purpose:
+    - Returns the rows of `df` belonging to dataset `ds`.
+    - Uses the precomputed row positions in `groups` when present, otherwise compares the Dataset column.
+    - Binned files keep each dataset's rows together, so the positions are usually one contiguous run;
+      that is taken as a positional slice (a view) instead of gathering every row into a copy.
+    """
+    rows = groups.get(ds)
+    if rows is None:
+        return df[df["Dataset"] == ds]
+    if len(rows) and rows[-1] - rows[0] + 1 == len(rows):   # positions are ascending and unique
+        return df.iloc[rows[0]:rows[-1] + 1]
+    return df.iloc[rows]
+
+class PlotSignals(QObject):
+    """
+    Purpose:
+    - Carries PlotRunnable's signals (a QRunnable is not a QObject and cannot declare its own).
+    """
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object, str, int)   # emits (fig, wrapped_html, generation)
+    errored  = pyqtSignal(str, int)           # emits (message, generation)
+
+class PlotRunnable(QRunnable):
     """
     Purpose:
     - Generates a Plotly graph from a DataFrame based on user selection.
+    - Runs on a shared QThreadPool, so repeated plots reuse pooled threads instead of starting a new one each time.
     - Handles both 'single' (multi-column within one dataset) and 'multi' (one column across datasets) modes.
     - Emits both the figure and wrapped HTML output for display or export.
     Args:
@@ -49,17 +142,23 @@ class PlotWorker(QThread):
     - key (str): Dataset name (if 'single') or column name (if 'multi').
     - items (list[str]): List of columns or datasets depending on mode.
     - df (pd.DataFrame): Source DataFrame containing data to plot.
-    Signals:
-    - finished (tuple): Emits (go.Figure, wrapped HTML string) upon success.
-    - errored (str): Emits error message if plotting fails.
+    - groups (dict[str, np.ndarray], optional): Dataset name -> row positions in df.
+    - generation (int): Caller's job number, echoed back so superseded results can be dropped.
+    - cancel (threading.Event, optional): When set, the job stops before its next expensive step and emits nothing.
+    Signals (on `self.signals`):
+    - progress (int): Emits 50 once the figure is built, 100 once its HTML is ready.
+    - finished (tuple): Emits (go.Figure, wrapped HTML string, generation) upon success.
+    - errored (tuple): Emits (error message, generation) if plotting fails.
     """
-    finished = pyqtSignal(object, str)   # emits (fig, wrapped_html)
-    errored  = pyqtSignal(str)
-
-    def __init__(self, mode: str, key: str, items: list[str], df):
+    def __init__(self, mode: str, key: str, items: list[str], df, groups: dict | None = None,
+                 generation: int = 0, cancel: threading.Event | None = None):
         super().__init__()
+        self.signals = PlotSignals()
         self.mode = mode
-        self._df  = df.copy()
+        self._df  = df   # read-only here; the loaded frame is never modified after GraphLoadWorker
+        self.groups = groups or {}
+        self.generation = generation
+        self.cancel = cancel or threading.Event()
 
         if mode == "single":
             self.dataset = key              # name of the single dataset
@@ -70,28 +169,34 @@ class PlotWorker(QThread):
 
     def run(self):
         try:
-            # give the UI spinner a moment
-            time.sleep(0.5)
+            if self.cancel.is_set():   #superseded while queued
+                return
 
             if self.mode == "single":
-                sub = self._df[self._df["Dataset"] == self.dataset]
+                sub = _dataset_rows(self._df, self.groups, self.dataset)
                 x_axis = "Time" if "Time" in sub.columns else sub.columns[0]
                 fig = sing_sub_plot(sub, x_axis, self.y_axes, title_text=self.dataset)
 
             else:  # multi‐subject
-                # we can pass the full DataFrame to the helper; it'll filter per‐ds internally
+                # the helper gathers each dataset's rows from the full DataFrame via the precomputed groups
                 x_axis = "Time" if "Time" in self._df.columns else self._df.columns[0]
-                fig = mult_sub_plot(self._df, x_axis, self.column, self.datasets)
+                fig = mult_sub_plot(self._df, x_axis, self.column, self.datasets, groups=self.groups or None)
+            if self.cancel.is_set():   #superseded while building; skip the HTML export
+                return
+            self.signals.progress.emit(50)
 
             # wrap into full HTML page
-            inner = fig.to_html(include_plotlyjs="cdn", full_html=False)
-            html  = wrap_html(inner)
+            html = figure_html(fig)
+            self.signals.progress.emit(100)
 
             # hand back to GUI thread
-            self.finished.emit(fig, html)
+            self.signals.finished.emit(fig, html, self.generation)
 
         except Exception as e:
-            self.errored.emit(str(e))
+            self.signals.errored.emit(str(e), self.generation)
+        finally:
+            # the pool may keep this runnable alive; don't let it pin the frame after a new file is loaded
+            self._df = self.groups = None
 
 class SaveMultipleWorker(QThread):
     """
@@ -99,75 +204,86 @@ class SaveMultipleWorker(QThread):
     - Saves individual multi-column plots for each selected dataset.
     - Uses `sing_sub_plot()` from graph/helpers.py to generate each figure.
     - Writes each plot as a standalone HTML file with auto-sizing applied.
+    - Files are rendered and written concurrently on a thread pool.
     Args:
     - datasets (list[str]): List of dataset labels to plot individually.
     - y_axes (list[str]): Columns to visualize for each dataset.
     - df (pd.DataFrame): Full dataset to slice per subject.
     - out_dir (str): Directory to save HTML output files.
+    - groups (dict[str, np.ndarray], optional): Dataset name -> row positions in df.
     Signals:
+    - progress (int): Emits the number of files written so far.
     - finished (tuple): Emits ([saved file paths], output directory) on success.
     - errored (str): Emits error message on failure.
     """
     # emits (list_of_paths, output_dir)
+    progress = pyqtSignal(int)
     finished = pyqtSignal(list, str)
     errored  = pyqtSignal(str)
 
-    def __init__(self, datasets: list[str], y_axes: list[str], df, out_dir: str):
+    def __init__(self, datasets: list[str], y_axes: list[str], df, out_dir: str, groups: dict | None = None):
         super().__init__()
         self.datasets = datasets
         self.y_axes   = y_axes
-        self._df      = df.copy()
+        self._df      = df   # read-only, as in PlotRunnable
         self.out_dir  = out_dir
+        self.groups   = groups or {}
 
     def run(self):
-        import time, os
-
         try:
-            time.sleep(0.5)
-            saved = []
-
-            for ds in self.datasets:
-                # 1) filter down
-                sub = self._df[self._df["Dataset"] == ds]
-                # 2) pick X-axis
-                x_axis = "Time" if "Time" in sub.columns else sub.columns[0]
-
-                # 3) build figure (this also sets fig._filename)
-                fig = sing_sub_plot(sub, x_axis, self.y_axes, title_text=ds)
-
-                # 4) auto-size & margin
-                fig.update_layout(
-                    autosize=True,
-                    height=200 * len(self.y_axes) + 100,
-                    margin=dict(l=200, r=20, t=40, b=40)
-                )
-
-                # 5) write out HTML using the same name sing_sub_plot created
-                default_name = getattr(fig, "_filename", f"{ds}.html")
-                out_path     = os.path.join(self.out_dir, default_name)
-                fig.write_html(out_path, include_plotlyjs="cdn", full_html=True)
-                saved.append(out_path)
-
+            x_axis = "Time" if "Time" in self._df.columns else self._df.columns[0]   # row slices keep every column
+            target = lambda ds: sing_sub_plot_filename(ds, x_axis, self.y_axes)
+            saved = _save_all(self.datasets, self._render_one, self.progress.emit, target)
             self.finished.emit(saved, self.out_dir)
 
         except Exception as e:
             self.errored.emit(str(e))
+        finally:
+            self._df = self.groups = None   # the panel keeps this worker until the next save; release the frame now
+
+    def _render_one(self, ds: str) -> str:
+        """
+        Purpose:
+        - Builds and writes the figure for one dataset; returns the written path.
+        """
+        # 1) filter down
+        sub = _dataset_rows(self._df, self.groups, ds)
+        # 2) pick X-axis
+        x_axis = "Time" if "Time" in sub.columns else sub.columns[0]
+
+        # 3) build figure (this also sets fig._filename)
+        fig = sing_sub_plot(sub, x_axis, self.y_axes, title_text=ds, as_dict=True)
+
+        # 4) write out HTML using the same name sing_sub_plot created, auto-sized with export margins
+        #    (applied to the written page only; the figure may be shared through the plot cache)
+        default_name = getattr(fig, "_filename", f"{ds}.html")
+        out_path     = os.path.join(self.out_dir, default_name)
+        write_figure_html(fig, out_path, layout=dict(
+            autosize=True,
+            height=200 * len(self.y_axes) + 100,
+            margin=dict(l=200, r=20, t=40, b=40)
+        ))
+        return out_path
 
 class SaveMultiColumnWorker(QThread):
     """
     Purpose:
     - Saves cross-dataset plots for each selected column.
     - Uses `mult_sub_plot()` to show how each column varies across datasets.
-    - Wraps each figure in a scrollable HTML shell and writes to disk.
+    - Writes each figure to disk inside the scrollable HTML shell.
+    - Files are rendered and written concurrently on a thread pool.
     Args:
     - datasets (list[str]): List of datasets to include in each subplot.
     - columns (list[str]): Columns to plot one at a time.
     - df (pd.DataFrame): Full dataset, assumed to contain all columns and 'Dataset' tag.
     - out_dir (str): Directory to save the resulting HTML files.
+    - groups (dict[str, np.ndarray], optional): Dataset name -> row positions in df, shared by every column.
     Signals:
+    - progress (int): Emits the number of files written so far.
     - finished (tuple): Emits ([saved file paths], output directory) on success.
     - errored (str): Emits error string on failure.
     """
+    progress = pyqtSignal(int)
     finished = pyqtSignal(list, str)   # (saved_paths, out_dir)
     errored  = pyqtSignal(str)
 
@@ -175,48 +291,91 @@ class SaveMultiColumnWorker(QThread):
                  datasets: list[str],  # list of dataset names
                  columns:  list[str],  # list of columns to plot
                  df,                   # full DataFrame loaded via graph_file_loaded
-                 out_dir:  str):
+                 out_dir:  str,
+                 groups:   dict | None = None):
         super().__init__()
         self.datasets = datasets
         self.columns  = columns
-        self._df      = df.copy()
+        self._df      = df   # read-only, as in PlotRunnable
         self.out_dir  = out_dir
+        self.groups   = groups or None
 
     def run(self):
-        saved = []
         try:
-            time.sleep(0.2)
-
             # pick X-axis just once
-            x_axis = "Time" if "Time" in self._df.columns else self._df.columns[0]
-
-            for col in self.columns:
-                fig = mult_sub_plot(
-                    self._df,
-                    x_axis=x_axis,
-                    column=col,
-                    selected_ds=self.datasets
-                )
-
-                # auto-size & wrap
-                fig.update_layout(
-                    autosize=True,
-                    width=1000,
-                    height=200 * (len(self.datasets) + 1) + 100,
-                    margin=dict(l=200, r=20, t=50, b=40)
-                )
-                inner = fig.to_html(include_plotlyjs="cdn", full_html=False)
-                html  = wrap_html(inner)
-
-                # get filename that mult_sub_plot set on fig
-                filename = getattr(fig, "_filename", f"{col}.html")
-                out_path = os.path.join(self.out_dir, filename)
-                with open(out_path, "w", encoding="utf-8") as f:
-                    f.write(html)
-
-                saved.append(out_path)
+            self._x_axis = "Time" if "Time" in self._df.columns else self._df.columns[0]
 
+            target = lambda col: mult_sub_plot_filename(col, self.datasets)
+            saved = _save_all(self.columns, self._render_one, self.progress.emit, target)
             self.finished.emit(saved, self.out_dir)
 
         except Exception as e:
-            self.errored.emit(str(e))
\ No newline at end of file
+            self.errored.emit(str(e))
+        finally:
+            self._df = self.groups = None   # the panel keeps this worker until the next save; release the frame now
+
+    def _render_one(self, col: str) -> str:
+        """
+        Purpose:
+        - Builds and writes the cross-dataset figure for one column; returns the written path.
+        """
+        fig = mult_sub_plot(
+            self._df,
+            x_axis=self._x_axis,
+            column=col,
+            selected_ds=self.datasets,
+            as_dict=True,
+            groups=self.groups
+        )
+
+        # get filename that mult_sub_plot set on fig
+        filename = getattr(fig, "_filename", f"{col}.html")
+        out_path = os.path.join(self.out_dir, filename)
+
+        # auto-size in the written page only; the figure may be shared through the plot cache
+        write_figure_html(fig, out_path, scroll=True, layout=dict(
+            autosize=True,
+            width=1000,
+            height=200 * (len(self.datasets) + 1) + 100,
+            margin=dict(l=200, r=20, t=50, b=40)
+        ))
+        return out_path
+
+def _save_all(items: list[str], render_one, on_progress, target_of) -> list[str]:
+    """
+    Purpose:
+    - Runs `render_one(item)` for every item on a thread pool, so figure JSON encoding
+      and file writes for different outputs overlap.
+    - Items whose `target_of(item)` filename is the same (e.g. "a b" and "a/b", or long names cut to the
+      same stem) share one task and are written one after another, so the last one wins as in a
+      sequential save instead of two threads writing one file at once.
+    - Uses at least two threads even on one core: file writes release the GIL, so one file
+      can be written while the next is being built.
+    - Calls `on_progress(n_done)` as each file completes; on the first failure the pending items are
+      cancelled and the error is re-raised.
+    Returns:
+    - list[str]: Written paths, in `items` order.
+    """
+    by_target = {}
+    for i, item in enumerate(items):
+        by_target.setdefault(target_of(item), []).append(i)
+
+    saved = [None] * len(items)
+    def render_group(indices):
+        for i in indices:
+            saved[i] = render_one(items[i])
+        return len(indices)
+
+    n_workers = max(1, min(max(2, os.cpu_count() or 1), MAX_SAVE_WORKERS, len(by_target)))
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(render_group, indices) for indices in by_target.values()]
+        try:
+            n_done = 0
+            for future in as_completed(futures):
+                n_done += future.result()     #re-raises the first failure
+                on_progress(n_done)
+        except Exception:
+            for future in futures:
+                future.cancel()     #only groups not yet started; running ones finish before the pool exits
+            raise
+    return saved
@@ -7,9 +7,216 @@ Purpose:
 """
 
 import os
-import glob
+import numpy as np
 import pandas as pd
 from typing import Optional
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from config import TIME_COLUMN
+
+try:
+    import pyarrow as pa  #Optional; enables pyarrow's multi-threaded CSV reader
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pa_parquet
+    PYARROW_AVAILABLE = True
+    #Timestamps stay text so merged_data.csv keeps the loggers' own format; "" and other NA markers read as null like pandas
+    _ARROW_CONVERT = pa_csv.ConvertOptions(column_types={TIME_COLUMN: pa.string()}, strings_can_be_null=True)
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+MAX_MERGE_WORKERS = 8   #Upper bound on subfolder reader threads
+
+
+def _list_files(path: str) -> list[str]:
+    """
+    Purpose:
+    - Lists the data files in a subfolder in one os.scandir() pass; the file-type check is answered from
+      the directory read instead of a stat per entry.
+    - Like glob("*"), hidden entries are skipped; the loggers' files have no fixed extension (.DAT, .CSV).
+    """
+    with os.scandir(path) as entries:
+        return [e.path for e in entries if e.is_file() and not e.name.startswith(".")]
+
+
+def _process_sub(folder: str, sub: str) -> Optional[list[pd.DataFrame]]:
+    """
+    Purpose:
+    - Reads all .CSV files from a subdirectory and tags each with the subfolder name.
+    - Runs on run_merge_script()'s thread pool, one call per subfolder.
+    - The files are not concatenated here; run_merge_script() joins every file of every subfolder
+      in a single pd.concat, so the data is copied once rather than per subfolder and again overall.
+    Args:
+    - folder (str): Master directory containing the subfolder.
+    - sub (str): Name of the subdirectory to process.
+    Returns:
+    - Optional[list[pd.DataFrame]]: One DataFrame per file with a categorical 'Dataset' column added, or None if no files loaded.
+    """
+    path = os.path.join(folder, sub)
+    dfs = []
+
+    for fp in _list_files(path):
+        try:
+            df = pd.read_csv(fp)
+        except Exception as e:
+            print(f"Error reading {fp}: {e}")
+            continue
+        if "Dataset" in df.columns:   #a file's own Dataset column is replaced by the folder name
+            del df["Dataset"]
+        #Inserted in place as the leftmost column (a new block), instead of assigning then reindexing every column
+        df.insert(0, "Dataset", pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), [sub]))   #one stored label, like the pyarrow path
+        dfs.append(df)
+
+    return dfs or None
+
+
+def _read_sub_arrow(folder: str, sub: str, labels: Optional[list[str]] = None) -> Optional["pa.Table"]:
+    """
+    Purpose:
+    - pyarrow counterpart of _process_sub(): reads a subdirectory's .CSV files into one Arrow table
+      with a leading 'Dataset' column, leaving the conversion (or writing) to the caller.
+    - 'Dataset' is dictionary-encoded: the folder names are stored once and each row holds a 32-bit index.
+    Args:
+    - folder (str): Master directory containing the subfolder.
+    - sub (str): Name of the subdirectory to process.
+    - labels (list[str], optional): Dictionary shared by every subfolder (sorted folder names), so all
+      chunks of the merged column carry the same one; defaults to just `sub`.
+    Returns:
+    - Optional[pa.Table]: Tagged table, or None if no files loaded.
+    """
+    path = os.path.join(folder, sub)
+    tables = []
+
+    for fp in _list_files(path):
+        try:
+            tables.append(pa_csv.read_csv(fp, convert_options=_ARROW_CONVERT))
+        except Exception as e:
+            print(f"Error reading {fp}: {e}")
+
+    if not tables:
+        return None
+
+    labels = labels or [sub]
+    table = pa.concat_tables(tables, promote_options="permissive")
+    if "Dataset" in table.column_names:
+        table = table.drop_columns(["Dataset"])
+    codes = np.full(table.num_rows, labels.index(sub), dtype=np.int32)
+    return table.add_column(0, "Dataset", pa.DictionaryArray.from_arrays(pa.array(codes), pa.array(labels)))
+
+
+def _fill_null_columns(table: "pa.Table") -> "pa.Table":
+    """
+    Purpose:
+    - Types columns that were empty in every file as float64, so they come back as float NaN
+      (as pd.read_csv gives) instead of None objects.
+    """
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table
+
+
+def _arrow_to_pandas(table: "pa.Table") -> pd.DataFrame:
+    """
+    Purpose:
+    - Converts the merged Arrow table from _merge_arrow() (null-typed columns already float64) to pandas in one pass.
+    - Arrow buffers are released column by column as the pandas blocks are built (self_destruct), so peak memory
+      stays near one copy of the data; `table` must not be used afterwards.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _read_subfolders(folder: str, subdirs: list[str], read_sub, status_callback=None) -> list:
+    """
+    Purpose:
+    - Runs `read_sub(folder, sub)` for every subfolder on a thread pool.
+    - Fires status_callback from the calling thread as each folder completes.
+    Returns:
+    - list: Non-empty results in `subdirs` order, so the merged row order doesn't depend on timing.
+    """
+    total = len(subdirs)
+    n_workers = min(os.cpu_count() or 1, MAX_MERGE_WORKERS, total)
+
+    parts = [None] * total
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        futures = {pool.submit(read_sub, folder, sub): i for i, sub in enumerate(subdirs)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            parts[futures[future]] = future.result()
+            if status_callback:
+                status_callback(f"Processing folder {done} of {total}…")
+
+    return [part for part in parts if part is not None]
+
+
+def save_merged(df: pd.DataFrame, out_path: str):
+    """
+    Purpose:
+    - Writes a merged DataFrame to `out_path` as CSV with df.to_csv, so the file keeps pandas' format
+      (minimal quoting, floats such as 8.0) whichever reader produced the data.
+    - With pyarrow installed, also writes a zstd Parquet copy beside it (same stem) that the binning step
+      loads instead of re-parsing the CSV; skipped when a column won't convert to Arrow
+      (e.g. mixed-type columns from the pandas path).
+    Args:
+    - df (pd.DataFrame): Merged data from run_merge_script().
+    - out_path (str): Destination .csv path.
+    """
+    df.to_csv(out_path, index=False)
+
+    parquet_path = os.path.splitext(out_path)[0] + ".parquet"
+    if PYARROW_AVAILABLE:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None
+        if table is not None:
+            pa_parquet.write_table(table, parquet_path, compression="zstd")   #written last, so it is never older than the CSV
+            return
+
+    if os.path.exists(parquet_path):
+        os.remove(parquet_path)   #a copy from an earlier merge would no longer match the CSV
+
+
+def _list_subdirs(folder: str) -> list[str]:
+    """
+    Purpose:
+    - Lists the subfolders of `folder` to merge (all but "exports") in one os.scandir() pass.
+    """
+    if not os.path.isdir(folder):
+        raise FileNotFoundError(f"Folder not found: {folder}")
+
+    with os.scandir(folder) as entries:
+        return [e.name for e in entries if e.is_dir() and e.name != "exports"]
+
+
+def _merge_arrow(folder: str, subdirs: list[str], status_callback=None) -> Optional["pa.Table"]:
+    """
+    Purpose:
+    - Reads every subfolder with pyarrow and concatenates the tables without copying (chunks are referenced).
+    - Columns that were empty in every file are typed float64 here (_fill_null_columns), once for the whole
+      merge, so the table is ready for _arrow_to_pandas().
+    - Raises pa.ArrowInvalid / pa.ArrowTypeError when a column's type differs between files.
+    Returns:
+    - Optional[pa.Table]: Merged table with null-typed columns as float64, or None if nothing loaded.
+    """
+    read_sub = partial(_read_sub_arrow, labels=sorted(subdirs))   #sorted, so Dataset sorts by name downstream
+    tables = _read_subfolders(folder, subdirs, read_sub, status_callback)
+    if not tables:
+        return None
+    return _fill_null_columns(pa.concat_tables(tables, promote_options="permissive"))
+
+
+def _merge_pandas(folder: str, subdirs: list[str], status_callback=None) -> Optional[pd.DataFrame]:
+    """
+    Purpose:
+    - pandas fallback for _merge_arrow(): reads every file and joins them all in a single pd.concat.
+    """
+    frames = [df for part in _read_subfolders(folder, subdirs, _process_sub, status_callback) for df in part]
+    if not frames:
+        return None
+    #Give every file the same (sorted) categories first; concat of differing categoricals would fall back to object
+    labels = sorted({cat for df in frames for cat in df["Dataset"].cat.categories})
+    for df in frames:
+        df["Dataset"] = df["Dataset"].cat.set_categories(labels)
+    return pd.concat(frames, ignore_index=True)
 
 
 def run_merge_script(folder: str, status_callback=None) -> Optional[pd.DataFrame]:
@@ -17,60 +224,46 @@ def run_merge_script(folder: str, status_callback=None) -> Optional[pd.DataFrame
     Purpose:
     - Scans subdirectories of `folder`, loads all .CSV files into DataFrames,
     - adds a source label, and concatenates them into a single long-format DataFrame.
+    - Subfolders are read in parallel on a thread pool, with pyarrow's CSV reader when it is installed.
     - Returns None if nothing could be merged.
     Args:
     - folder (str): Path to the master directory containing subfolders of .CSV files.
     Returns:
     - Optional[pd.DataFrame]: Long-format DataFrame if merge succeeds, else None.
     """
-    if not os.path.isdir(folder):
-        raise FileNotFoundError(f"Folder not found: {folder}")
-
-    subdirs = [
-        sub_folder for sub_folder in os.listdir(folder)
-        if os.path.isdir(os.path.join(folder, sub_folder)) and sub_folder != "exports"
-    ]
+    subdirs = _list_subdirs(folder)
     if not subdirs:
         return None
 
-    total = len(subdirs)
+    if PYARROW_AVAILABLE:
+        try:
+            table = _merge_arrow(folder, subdirs, status_callback)
+            if table is None:
+                return None
+            df = _arrow_to_pandas(table)
+            del table
+            df["Dataset"] = df["Dataset"].cat.remove_unused_categories()   #folders with no readable files, as in the pandas path
+            return df
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  #a column's type differs between files; re-read with pandas, which falls back to object
+
+    return _merge_pandas(folder, subdirs, status_callback)
 
-    def process(sub: str, index: int) -> Optional[pd.DataFrame]:
-        """
-        Purpose:
-        - Reads all .CSV files from a subdirectory and tags them with the subfolder name.
-        - Fires status_callback after processing is complete.
-        Args:
-        - sub (str): Name of the subdirectory to process.
-        - index (int): Position in the list for progress tracking.
-        Returns:
-        - Optional[pd.DataFrame]: DataFrame with 'Dataset' column added, or None if no files loaded.
-        """
-        path = os.path.join(folder, sub)
-        dfs = []
-
-        for fp in glob.glob(os.path.join(path, "*")):
-            try:
-                dfs.append(pd.read_csv(fp))
-            except Exception as e:
-                print(f"Error reading {fp}: {e}")
-
-        if not dfs:
-            return None
-
-        df = pd.concat(dfs, ignore_index=True)
-        df["Dataset"] = sub
-        cols = ["Dataset"] + [c for c in df.columns if c != "Dataset"]
-
-        if status_callback:
-            status_callback(f"Processing folder {index + 1} of {total}…")
-
-        return df[cols]
-
-    parts = []
-    for i, subs in enumerate(subdirs):
-        dfr = process(subs, i)
-        if dfr is not None:
-            parts.append(dfr)
-
-    return pd.concat(parts, ignore_index=True) if parts else None
\ No newline at end of file
+
+def merge_to_file(folder: str, out_path: str, status_callback=None) -> Optional[int]:
+    """
+    Purpose:
+    - Merges `folder` with run_merge_script() and writes the result to `out_path` through save_merged()
+      (CSV, plus a Parquet copy when pyarrow is installed), so MergeWorker never holds on to the DataFrame.
+    - Both readers share this one path, so the written files are the same whichever one ran.
+    Args:
+    - folder (str): Path to the master directory containing subfolders of .CSV files.
+    - out_path (str): Destination .csv path.
+    Returns:
+    - Optional[int]: Number of merged rows written, or None if nothing could be merged (no file is written).
+    """
+    df = run_merge_script(folder, status_callback)
+    if df is None:
+        return None
+    save_merged(df, out_path)
+    return len(df)
@@ -31,7 +31,6 @@ class MergePanel(QGroupBox):
         """
         super().__init__("1) Merge text (or .DAT) Files", parent)
         self.folder = None
-        self.dataframe = None
         self.worker = None
         self._build_ui()
     def _build_ui(self):
@@ -106,19 +105,18 @@ class MergePanel(QGroupBox):
         self.worker.status.connect(self._on_status_update)
         self.worker.start() #kick off worker
 
-    def _on_done(self, dataframe, out_path):
+    def _on_done(self, rows, out_path):
         """
         Purpose:
         - Called when worker finishes successfully.
         - Restores UI state, emits filepath, and shows completion message.
         Args:
-        - dataframe (pd.DataFrame): The merged dataset.
+        - rows (int): Number of merged rows written.
         - out_path (str): File path where the Excel file was saved.
         """
         self.merge_progress.hide()
         self.btn_merge.show()
         self.status_lbl.clear()
-        self.dataframe = dataframe
 
         display_path = os.path.normpath(out_path)
         self.merged_filepath.emit(display_path) #Emit the filepath for use in binning functionality
@@ -126,7 +124,7 @@ class MergePanel(QGroupBox):
         QMessageBox.information(
             self,
             "Merge Complete",
-            f"Merged {len(dataframe)} rows.\nSaved to:\n{display_path}"
+            f"Merged {rows} rows.\nSaved to:\n{display_path}"
         )
 
     def _on_error(self, msg):
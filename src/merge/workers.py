@@ -6,19 +6,18 @@ Purpose:
 """
 
 import os
-import pandas as pd
 from PyQt6.QtCore import QThread, pyqtSignal
-from merge.helpers import run_merge_script
+from merge.helpers import merge_to_file
 
 
 class MergeWorker(QThread):
     """
     Purpose:
     - Background thread responsible for executing the merge logic.
-    - Emits a DataFrame and output path on success, or an error message on failure.
+    - Emits the merged row count and output path on success, or an error message on failure.
     """
 
-    finished = pyqtSignal(pd.DataFrame, str)  #Fired when merge completes successfully
+    finished = pyqtSignal(int, str)  #Fired when merge completes successfully
     errored  = pyqtSignal(str)                       #Fired if merge fails
     status = pyqtSignal(str)             #Emits status messages to the GUI
 
@@ -43,16 +42,15 @@ class MergeWorker(QThread):
         - Saves the result to csv and emits success or error signals.
         """
         try:
-            df = run_merge_script(self.folder, status_callback=self.status.emit) #Run the user-defined merge logic (returns a DataFrame)
-
-            if df is None:
-                raise RuntimeError("No data merged; check your data folder.")
-
             filename = "merged_data.csv" #Save final csv to exports folder
             out_path = os.path.join(self.export_dir, filename)
-            df.to_csv(out_path, index=False)
+            #Merge and write in one step; with pyarrow the merged table goes straight to disk (plus merged_data.parquet)
+            rows = merge_to_file(self.folder, out_path, status_callback=self.status.emit)
+
+            if rows is None:
+                raise RuntimeError("No data merged; check your data folder.")
 
-            self.finished.emit(df, out_path) #Notify main thread of success
+            self.finished.emit(rows, out_path) #Notify main thread of success
 
         except Exception as e:
             self.errored.emit(str(e)) #Bubble up error message to UI
\ No newline at end of file